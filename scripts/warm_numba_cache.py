@@ -0,0 +1,53 @@
+"""Compile every njit kernel once so later runs load machine code from disk.
+
+All kernels are declared ``@njit(cache=True)``: numba writes the compiled code
+to ``__pycache__`` the first time each signature is seen and reuses it in
+every later process. Running this after install (or after changing a kernel)
+moves that one-off compile out of the first backtest / pytest run.
+
+The indicator and streak kernels are reached through the public wrappers
+production code uses. The exit-scan kernel has no public wrapper, so the
+private ``backtest._scan_exit`` is called directly with the argument types
+run_backtest passes (int direction/index/time, float prices, int64 and
+float64 arrays). Either way the cached signatures are the ones production
+will request.
+
+Usage:
+    uv run python scripts/warm_numba_cache.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from crypto_trade.backtest import _scan_exit
+from crypto_trade.indicators import ema, rolling_mean_std, rsi, rsi_series
+from crypto_trade.strategies.price_action._numba_kernels import streak_by
+
+
+def main() -> None:
+    closes = np.linspace(100.0, 110.0, 64)
+    symbols = pd.Series(["A"] * 32 + ["B"] * 32)
+    open_times = np.arange(64, dtype=np.int64) * 900_000
+
+    kernels = {
+        "ema": lambda: ema(closes, 14),
+        "rsi": lambda: rsi(closes, 14),
+        "rsi_series": lambda: rsi_series(pd.Series(closes), 14),
+        "rolling_mean_std": lambda: rolling_mean_std(closes, 20),
+        "streak_by": lambda: streak_by(closes > 105.0, symbols, 3),
+        "scan_exit": lambda: _scan_exit(
+            1, 95.0, 115.0, int(open_times[-1]), open_times, closes, closes, closes, 0
+        ),
+    }
+    for name, call in kernels.items():
+        start = time.perf_counter()
+        call()
+        print(f"{name:<18} {time.perf_counter() - start:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Optional numba JIT decorator.
+
+numba is a declared dependency: the rolling, RSI, streak and exit-scan
+kernels are written as element-wise loops and are only fast compiled. The
+fallback below, where ``njit`` returns the function unchanged, exists so a
+broken numba/llvmlite install degrades to correct-but-slow plain Python
+instead of an ImportError.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+
+        return decorator
+
+
+__all__ = ["njit"]
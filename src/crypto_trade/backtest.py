@@ -7,6 +7,7 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from crypto_trade._njit import njit
 from crypto_trade.backtest_models import (
     BacktestConfig,
     BacktestResult,
@@ -18,6 +19,16 @@ from crypto_trade.backtest_models import (
 from crypto_trade.kline_array import load_kline_array
 from crypto_trade.storage import csv_path
 
+# Signal weights are integers in [0, 100]; precompute their weight factors so
+# create_order does a tuple lookup instead of a float division per trade.
+_WEIGHT_FACTORS: tuple[float, ...] = tuple(w / 100.0 for w in range(101))
+
+# Exit codes returned by _scan_exit.
+_EXIT_NONE = 0
+_EXIT_TIMEOUT = 1
+_EXIT_STOP_LOSS = 2
+_EXIT_TAKE_PROFIT = 3
+
 
 def _sync_label_params(strategy: Strategy, config: BacktestConfig) -> None:
     """Push backtest config TP/SL/timeout into ML strategies that use them for labeling.
@@ -59,6 +70,16 @@ def _detect_verbose(strategy: Strategy) -> int:
             return 0
 
 
+def _can_trade(strategy: Strategy) -> bool:
+    """Return False only when the strategy declares it can never emit a signal.
+
+    ``can_trade()`` is an optional strategy method; strategies without it
+    are assumed to trade.
+    """
+    can_trade = getattr(strategy, "can_trade", None)
+    return True if can_trade is None else bool(can_trade())
+
+
 def _flush_predict_log(strategy: Strategy) -> None:
     """Walk chain, print and clear any stored ``_last_predict_log``."""
     target = strategy
@@ -146,6 +167,10 @@ def run_backtest(
     If *yearly_pnl_check* is True, checks cumulative PnL at each year
     boundary. Raises EarlyStopError if year-1 PnL is negative.
     """
+    # A strategy that can never trade produces no results; skip loading data.
+    if not _can_trade(strategy):
+        return BacktestResult([], 0)
+
     if profile_memory:
         tracemalloc.start()
 
@@ -168,8 +193,12 @@ def run_backtest(
     if profile_memory:
         _mem_report("after compute_features")
 
-    # Extract numpy arrays for fast iteration
-    sym_arr = master["symbol"].to_numpy(dtype=str)
+    # Extract numpy arrays for fast iteration. Symbols are kept as compact
+    # category codes plus a names lookup rather than a fixed-width unicode
+    # array, so each row carries a small int instead of a padded string.
+    sym_cat = pd.Categorical(master["symbol"])
+    sym_names = [str(s) for s in sym_cat.categories]
+    sym_codes = sym_cat.codes.tolist()
     open_time_arr = master["open_time"].values
     close_time_arr = master["close_time"].values
     open_arr = master["open"].values
@@ -177,7 +206,33 @@ def run_backtest(
     low_arr = master["low"].values
     close_arr = master["close"].values
 
+    # Per-symbol contiguous bar arrays for the compiled exit scan, plus each
+    # master row's position within its symbol's bars.
+    codes_arr = sym_cat.codes
+    sym_rows = [np.flatnonzero(codes_arr == c) for c in range(len(sym_names))]
+    row_pos = np.empty(len(master), dtype=np.int64)
+    for rows in sym_rows:
+        row_pos[rows] = np.arange(len(rows))
+    sym_bars = [
+        (
+            np.ascontiguousarray(open_time_arr[rows], dtype=np.int64),
+            np.ascontiguousarray(open_arr[rows], dtype=np.float64),
+            np.ascontiguousarray(high_arr[rows], dtype=np.float64),
+            np.ascontiguousarray(low_arr[rows], dtype=np.float64),
+        )
+        for rows in sym_rows
+    ]
+    # Native Python scalars for the per-row loop: a list index is cheaper than
+    # boxing a numpy scalar and converting it with int()/float() on every bar.
+    open_times = open_time_arr.astype(np.int64).tolist()
+    close_times = close_time_arr.astype(np.int64).tolist()
+    opens = open_arr.astype(np.float64).tolist()
+    closes = close_arr.astype(np.float64).tolist()
+
+    fee_pct = config.fee_pct
     open_orders: dict[str, Order] = {}
+    # symbol -> (master row where its open order exits, exit code)
+    pending_exits: dict[str, tuple[int, int]] = {}
     results: list[TradeResult] = []
     total_signals = 0
 
@@ -193,12 +248,15 @@ def run_backtest(
     # Risk R2 tracking — drawdown-triggered position scaling (iter 175)
     cum_weighted_pnl = 0.0
     peak_weighted_pnl = 0.0
+    r2_trigger = float(config.risk_drawdown_trigger_pct)
+    r2_anchor = float(config.risk_drawdown_scale_anchor_pct)
+    r2_floor = float(config.risk_drawdown_scale_floor)
     candle_duration_ms = 0
     if config.cooldown_candles > 0 and len(master) >= 2:
         # Compute candle duration from first two rows of same symbol
-        first_sym = str(sym_arr[0])
+        first_code = sym_codes[0]
         for j in range(1, len(master)):
-            if str(sym_arr[j]) == first_sym:
+            if sym_codes[j] == first_code:
                 candle_duration_ms = int(open_time_arr[j] - open_time_arr[0])
                 break
         if candle_duration_ms <= 0:
@@ -210,14 +268,24 @@ def run_backtest(
         and candle_duration_ms == 0
         and len(master) >= 2
     ):
-        first_sym = str(sym_arr[0])
+        first_code = sym_codes[0]
         for j in range(1, len(master)):
-            if str(sym_arr[j]) == first_sym:
+            if sym_codes[j] == first_code:
                 candle_duration_ms = int(open_time_arr[j] - open_time_arr[0])
                 break
         if candle_duration_ms <= 0:
             candle_duration_ms = int(close_time_arr[0] - open_time_arr[0] + 1)
 
+    # Resolve the config's shape once so the row loop tests plain locals
+    # instead of re-reading config attributes on every trade and signal.
+    vol_targeting = config.vol_targeting
+    r2_enabled = config.risk_drawdown_scale_enabled
+    cooldown_ms = 0
+    if config.cooldown_candles > 0 and candle_duration_ms > 0:
+        cooldown_ms = config.cooldown_candles * candle_duration_ms
+    sl_limit = config.risk_consecutive_sl_limit if candle_duration_ms > 0 else None
+    sl_cooldown_ms = config.risk_consecutive_sl_cooldown_candles * candle_duration_ms
+
     # Running PnL accumulators for verbose logging
     cum_net_pnl = 0.0
     month_net_pnl = 0.0
@@ -231,117 +299,102 @@ def run_backtest(
     _yearly_wins: dict[int, int] = {}
 
     for i in range(len(master)):
-        sym = str(sym_arr[i])
-        ot = int(open_time_arr[i])
+        sym = sym_names[sym_codes[i]]
+        ot = open_times[i]
 
-        # (a) Check open order for this symbol
-        if sym in open_orders:
-            result = check_order(
+        # (a) Close this symbol's open order if its precomputed exit is here
+        if sym in open_orders and pending_exits[sym][0] == i:
+            result = _exit_result(
                 open_orders[sym],
+                pending_exits[sym][1],
                 ot,
-                float(open_arr[i]),
-                float(high_arr[i]),
-                float(low_arr[i]),
-                int(close_time_arr[i]),
-                config.fee_pct,
+                opens[i],
+                close_times[i],
+                fee_pct,
             )
-            if result is not None:
-                results.append(result)
-                del open_orders[sym]
-                # Record per-symbol daily PnL for vol targeting lookback
-                if config.vol_targeting:
-                    close_date_str = _day_of(result.close_time)
-                    sym_daily = vt_per_sym_daily.setdefault(result.symbol, {})
-                    sym_daily[close_date_str] = (
-                        sym_daily.get(close_date_str, 0.0) + result.net_pnl_pct
-                    )
-                # Set signal cooldown for this symbol
-                if config.cooldown_candles > 0 and candle_duration_ms > 0:
-                    cooldown_until[sym] = (
-                        result.close_time + config.cooldown_candles * candle_duration_ms
-                    )
-                # Risk R1 — track consecutive SL streak and arm cool-down
-                if config.risk_consecutive_sl_limit is not None and candle_duration_ms > 0:
-                    if result.exit_reason == "stop_loss":
-                        sl_streak[result.symbol] = sl_streak.get(result.symbol, 0) + 1
-                        if sl_streak[result.symbol] >= config.risk_consecutive_sl_limit:
-                            risk_cooldown_until[result.symbol] = (
-                                result.close_time
-                                + config.risk_consecutive_sl_cooldown_candles * candle_duration_ms
-                            )
-                            sl_streak[result.symbol] = 0  # reset streak after triggering
-                    else:
-                        sl_streak[result.symbol] = 0
-                # Risk R2 — update cumulative weighted PnL + running peak for
-                # drawdown-triggered scaling.
-                if config.risk_drawdown_scale_enabled:
-                    cum_weighted_pnl += result.weighted_pnl
-                    if cum_weighted_pnl > peak_weighted_pnl:
-                        peak_weighted_pnl = cum_weighted_pnl
-                # Yearly fail-fast check — per skill spec:
-                #   Year-1 boundary: check year-1 cumulative PnL ≥ 0
-                #   Year-2 boundary: check cumulative year-1+2 PnL ≥ 0
-                #   Silent after year 2.
-                if yearly_pnl_check:
-                    yr = datetime.datetime.fromtimestamp(
-                        result.close_time / 1000, tz=datetime.UTC
-                    ).year
-                    _yearly_pnl[yr] = _yearly_pnl.get(yr, 0.0) + result.net_pnl_pct
-                    _yearly_trades[yr] = _yearly_trades.get(yr, 0) + 1
-                    if result.net_pnl_pct > 0:
-                        _yearly_wins[yr] = _yearly_wins.get(yr, 0) + 1
-                    # Check at year boundary (when we enter a new year)
-                    if yr > _last_checked_year and _last_checked_year > 0:
-                        first_year = min(_yearly_pnl.keys())
-                        years_elapsed = _last_checked_year - first_year + 1
-                        # Only check year-1 and year-2 boundaries
-                        if years_elapsed == 1:
-                            prev_pnl = _yearly_pnl.get(_last_checked_year, 0.0)
-                            prev_n = _yearly_trades.get(_last_checked_year, 0)
-                            prev_w = _yearly_wins.get(_last_checked_year, 0)
-                            prev_wr = prev_w / prev_n * 100 if prev_n > 0 else 0
-                            if prev_n >= 10 and prev_pnl < 0:
-                                raise EarlyStopError(
-                                    f"Year 1 ({_last_checked_year}): PnL={prev_pnl:+.1f}% "
-                                    f"(WR={prev_wr:.1f}%, {prev_n} trades)",
-                                    results,
-                                    total_signals,
-                                )
-                        elif years_elapsed == 2:
-                            cum_pnl = sum(
-                                v for y, v in _yearly_pnl.items() if y <= _last_checked_year
+            results.append(result)
+            del open_orders[sym]
+            del pending_exits[sym]
+            # Record per-symbol daily PnL for vol targeting lookback
+            if vol_targeting:
+                close_date_str = _day_of(result.close_time)
+                sym_daily = vt_per_sym_daily.setdefault(result.symbol, {})
+                sym_daily[close_date_str] = sym_daily.get(close_date_str, 0.0) + result.net_pnl_pct
+            # Set signal cooldown for this symbol
+            if cooldown_ms > 0:
+                cooldown_until[sym] = result.close_time + cooldown_ms
+            # Risk R1 — track consecutive SL streak and arm cool-down
+            if sl_limit is not None:
+                if result.exit_reason == "stop_loss":
+                    sl_streak[result.symbol] = sl_streak.get(result.symbol, 0) + 1
+                    if sl_streak[result.symbol] >= sl_limit:
+                        risk_cooldown_until[result.symbol] = result.close_time + sl_cooldown_ms
+                        sl_streak[result.symbol] = 0  # reset streak after triggering
+                else:
+                    sl_streak[result.symbol] = 0
+            # Risk R2 — update cumulative weighted PnL + running peak for
+            # drawdown-triggered scaling.
+            if r2_enabled:
+                cum_weighted_pnl += result.weighted_pnl
+                if cum_weighted_pnl > peak_weighted_pnl:
+                    peak_weighted_pnl = cum_weighted_pnl
+            # Yearly fail-fast check — per skill spec:
+            #   Year-1 boundary: check year-1 cumulative PnL ≥ 0
+            #   Year-2 boundary: check cumulative year-1+2 PnL ≥ 0
+            #   Silent after year 2.
+            if yearly_pnl_check:
+                yr = datetime.datetime.fromtimestamp(result.close_time / 1000, tz=datetime.UTC).year
+                _yearly_pnl[yr] = _yearly_pnl.get(yr, 0.0) + result.net_pnl_pct
+                _yearly_trades[yr] = _yearly_trades.get(yr, 0) + 1
+                if result.net_pnl_pct > 0:
+                    _yearly_wins[yr] = _yearly_wins.get(yr, 0) + 1
+                # Check at year boundary (when we enter a new year)
+                if yr > _last_checked_year and _last_checked_year > 0:
+                    first_year = min(_yearly_pnl.keys())
+                    years_elapsed = _last_checked_year - first_year + 1
+                    # Only check year-1 and year-2 boundaries
+                    if years_elapsed == 1:
+                        prev_pnl = _yearly_pnl.get(_last_checked_year, 0.0)
+                        prev_n = _yearly_trades.get(_last_checked_year, 0)
+                        prev_w = _yearly_wins.get(_last_checked_year, 0)
+                        prev_wr = prev_w / prev_n * 100 if prev_n > 0 else 0
+                        if prev_n >= 10 and prev_pnl < 0:
+                            raise EarlyStopError(
+                                f"Year 1 ({_last_checked_year}): PnL={prev_pnl:+.1f}% "
+                                f"(WR={prev_wr:.1f}%, {prev_n} trades)",
+                                results,
+                                total_signals,
                             )
-                            cum_n = sum(
-                                v for y, v in _yearly_trades.items() if y <= _last_checked_year
+                    elif years_elapsed == 2:
+                        cum_pnl = sum(v for y, v in _yearly_pnl.items() if y <= _last_checked_year)
+                        cum_n = sum(v for y, v in _yearly_trades.items() if y <= _last_checked_year)
+                        if cum_n >= 20 and cum_pnl < 0:
+                            raise EarlyStopError(
+                                f"Year 1+2 cumulative: PnL={cum_pnl:+.1f}% ({cum_n} trades)",
+                                results,
+                                total_signals,
                             )
-                            if cum_n >= 20 and cum_pnl < 0:
-                                raise EarlyStopError(
-                                    f"Year 1+2 cumulative: PnL={cum_pnl:+.1f}% "
-                                    f"({cum_n} trades)",
-                                    results,
-                                    total_signals,
-                                )
-                    _last_checked_year = yr
-                if verbose > 0:
-                    month_label = _month_of(result.close_time)
-                    if month_label != current_month:
-                        month_net_pnl = 0.0
-                        current_month = month_label
-                    day_label = _day_of(result.close_time)
-                    if day_label != current_day:
-                        day_net_pnl = 0.0
-                        current_day = day_label
-                    cum_net_pnl += result.net_pnl_pct
-                    month_net_pnl += result.net_pnl_pct
-                    day_net_pnl += result.net_pnl_pct
-                    _log_trade_close(
-                        result,
-                        cum_net_pnl,
-                        month_net_pnl,
-                        current_month,
-                        day_net_pnl,
-                        current_day,
-                    )
+                _last_checked_year = yr
+            if verbose > 0:
+                month_label = _month_of(result.close_time)
+                if month_label != current_month:
+                    month_net_pnl = 0.0
+                    current_month = month_label
+                day_label = _day_of(result.close_time)
+                if day_label != current_day:
+                    day_net_pnl = 0.0
+                    current_day = day_label
+                cum_net_pnl += result.net_pnl_pct
+                month_net_pnl += result.net_pnl_pct
+                day_net_pnl += result.net_pnl_pct
+                _log_trade_close(
+                    result,
+                    cum_net_pnl,
+                    month_net_pnl,
+                    current_month,
+                    day_net_pnl,
+                    current_day,
+                )
 
         # (b) Ask strategy for signal
         signal = strategy.get_signal(sym, ot)
@@ -353,28 +406,35 @@ def run_backtest(
                 and ot >= risk_cooldown_until.get(sym, 0)
             ):
                 vt_scale = 1.0
-                if config.vol_targeting:
+                if vol_targeting:
                     vt_scale = compute_vt_scale(vt_per_sym_daily, sym, ot, config)
                 # R2 — drawdown-triggered position scaling
-                if config.risk_drawdown_scale_enabled:
+                if r2_enabled:
                     dd_pct = max(0.0, peak_weighted_pnl - cum_weighted_pnl)
-                    trigger = float(config.risk_drawdown_trigger_pct)
-                    anchor = float(config.risk_drawdown_scale_anchor_pct)
-                    floor = float(config.risk_drawdown_scale_floor)
-                    if dd_pct > trigger and anchor > trigger:
+                    if dd_pct > r2_trigger and r2_anchor > r2_trigger:
                         # Linear interp from 1.0 at trigger to floor at anchor
-                        span = min(1.0, (dd_pct - trigger) / (anchor - trigger))
-                        r2_scale = 1.0 - span * (1.0 - floor)
+                        span = min(1.0, (dd_pct - r2_trigger) / (r2_anchor - r2_trigger))
+                        r2_scale = 1.0 - span * (1.0 - r2_floor)
                         vt_scale = vt_scale * r2_scale
                 order = create_order(
                     sym,
                     signal,
-                    float(close_arr[i]),
-                    int(close_time_arr[i]),
+                    closes[i],
+                    close_times[i],
                     config,
                     vt_scale=vt_scale,
                 )
                 open_orders[sym] = order
+                code = sym_codes[i]
+                k, exit_code = _scan_exit(
+                    order.direction,
+                    order.stop_loss_price,
+                    order.take_profit_price,
+                    order.timeout_time,
+                    *sym_bars[code],
+                    int(row_pos[i]) + 1,
+                )
+                pending_exits[sym] = (int(sym_rows[code][k]) if k >= 0 else -1, exit_code)
                 if verbose > 0:
                     _flush_predict_log(strategy)
                     _log_trade_open(order)
@@ -382,14 +442,14 @@ def run_backtest(
     # End-of-data: force-close remaining orders
     last_per_sym: dict[str, int] = {}
     for i in range(len(master) - 1, -1, -1):
-        s = str(sym_arr[i])
+        s = sym_names[sym_codes[i]]
         if s not in last_per_sym:
             last_per_sym[s] = i
     for sym, order in open_orders.items():
         idx = last_per_sym[sym]
-        exit_price = float(close_arr[idx])
-        exit_time = int(close_time_arr[idx])
-        result = make_result(order, exit_price, exit_time, "end_of_data", config.fee_pct)
+        exit_price = closes[idx]
+        exit_time = close_times[idx]
+        result = make_result(order, exit_price, exit_time, "end_of_data", fee_pct)
         results.append(result)
         if verbose > 0:
             month_label = _month_of(result.close_time)
@@ -427,17 +487,20 @@ def build_master(
     data_dir: Path,
     start_time: int | None = None,
     end_time: int | None = None,
+    snapshot: bool = False,
 ) -> pd.DataFrame:
     """Build a single master DataFrame from kline CSVs, sorted by (open_time, symbol).
 
-    Shared by backtest and live modules.
+    Shared by backtest and live modules. *snapshot* is passed to
+    load_kline_array; only offline callers whose CSVs don't change between
+    runs should enable it.
     """
     frames: list[pd.DataFrame] = []
     lengths: list[int] = []
     syms: list[str] = []
     for symbol in symbols:
         path = csv_path(data_dir, symbol, interval)
-        ka = load_kline_array(path)
+        ka = load_kline_array(path, snapshot=snapshot)
         if len(ka) == 0:
             continue
         if start_time is not None or end_time is not None:
@@ -462,6 +525,7 @@ def _build_master(config: BacktestConfig) -> pd.DataFrame:
         config.data_dir,
         config.start_time,
         config.end_time,
+        snapshot=True,
     )
 
 
@@ -508,6 +572,62 @@ def check_order(
     return make_result(order, order.take_profit_price, close_time, "take_profit", fee_pct)
 
 
+@njit(cache=True)
+def _scan_exit(
+    direction: int,
+    stop_loss_price: float,
+    take_profit_price: float,
+    timeout_time: int,
+    open_times: np.ndarray,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    start: int,
+) -> tuple[int, int]:
+    """Find the first bar at or after *start* where an order exits.
+
+    Compiled counterpart of check_order over one symbol's bars, with the
+    same rule order and same-candle tie-break. Returns (bar index, exit
+    code), or (-1, _EXIT_NONE) if the order is still open at end of data.
+    """
+    for k in range(start, len(open_times)):
+        if open_times[k] >= timeout_time:
+            return k, _EXIT_TIMEOUT
+        if direction == 1:
+            sl_hit = lows[k] <= stop_loss_price
+            tp_hit = highs[k] >= take_profit_price
+        else:
+            sl_hit = highs[k] >= stop_loss_price
+            tp_hit = lows[k] <= take_profit_price
+        if sl_hit and tp_hit:
+            if direction == 1:
+                tp_wins = opens[k] >= take_profit_price
+            else:
+                tp_wins = opens[k] <= take_profit_price
+            return k, _EXIT_TAKE_PROFIT if tp_wins else _EXIT_STOP_LOSS
+        if sl_hit:
+            return k, _EXIT_STOP_LOSS
+        if tp_hit:
+            return k, _EXIT_TAKE_PROFIT
+    return -1, _EXIT_NONE
+
+
+def _exit_result(
+    order: Order,
+    exit_code: int,
+    open_time: int,
+    open_price: float,
+    close_time: int,
+    fee_pct: float,
+) -> TradeResult:
+    """Build the TradeResult for an exit found by _scan_exit."""
+    if exit_code == _EXIT_TIMEOUT:
+        return make_result(order, open_price, open_time, "timeout", fee_pct)
+    if exit_code == _EXIT_STOP_LOSS:
+        return make_result(order, order.stop_loss_price, close_time, "stop_loss", fee_pct)
+    return make_result(order, order.take_profit_price, close_time, "take_profit", fee_pct)
+
+
 def compute_vt_scale(
     per_sym_daily_pnl: dict[str, dict[str, float]],
     symbol: str,
@@ -571,7 +691,9 @@ def create_order(
         # When VT is off but a risk control (R2) passed in a sub-1.0 vt_scale,
         # apply it to the signal-derived weight. If no risk control fired
         # (vt_scale==1.0), the original signal-weight behaviour is preserved.
-        weight_factor = (signal.weight / 100.0) * vt_scale
+        w = signal.weight
+        base = _WEIGHT_FACTORS[w] if isinstance(w, int) and 0 <= w <= 100 else w / 100.0
+        weight_factor = base * vt_scale
     amount_usd = weight_factor * config.max_amount_usd
 
     sl_pct = (signal.sl_pct if signal.sl_pct is not None else config.stop_loss_pct) / 100.0
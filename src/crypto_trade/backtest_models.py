@@ -9,6 +9,14 @@ if TYPE_CHECKING:
 
 
 class Strategy(Protocol):
+    """Signal source driven by run_backtest and the live engine.
+
+    A strategy may also define an optional ``can_trade() -> bool``. When it
+    returns False, run_backtest returns an empty result without building the
+    master frame or calling compute_features. Strategies without it are
+    assumed to trade.
+    """
+
     def compute_features(self, master: pd.DataFrame) -> None:
         """Pre-compute features from master DF. Store internally."""
         ...
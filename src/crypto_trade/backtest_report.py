@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import math
-from collections import defaultdict
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from crypto_trade.backtest_models import DailyPnL, TradeResult
@@ -13,6 +15,8 @@ from crypto_trade.backtest_models import DailyPnL, TradeResult
 # Euler-Mascheroni constant for DSR computation (AFML Ch. 14)
 _EULER_MASCHERONI = 0.5772156649015328
 
+_DAY_MS = 86_400_000
+
 
 @dataclass(frozen=True)
 class BacktestSummary:
@@ -179,21 +183,39 @@ def compute_deflated_sharpe_ratio(
     return (sharpe - emax) / se
 
 
+def first_trade_per_symbol(results: list[TradeResult]) -> dict[str, TradeResult]:
+    """Return the earliest-closing trade for each symbol.
+
+    Sorts by (symbol, close_time) and takes the head of each symbol group;
+    the sort is stable, so ties keep their original result order.
+    """
+    ordered = sorted(results, key=attrgetter("symbol", "close_time"))
+    return {sym: next(grp) for sym, grp in groupby(ordered, key=attrgetter("symbol"))}
+
+
 def aggregate_daily_pnl(results: list[TradeResult]) -> list[DailyPnL]:
-    """Group trade results by close-time date (UTC) and compute daily averages."""
-    by_day: dict[str, list[TradeResult]] = defaultdict(list)
-    for r in results:
-        date_str = datetime.fromtimestamp(r.close_time / 1000, tz=UTC).strftime("%Y-%m-%d")
-        by_day[date_str].append(r)
+    """Group trade results by close-time date (UTC) and compute daily averages.
+
+    Days are bucketed on an int64 array of close times (``close_time // 1 day``)
+    so the date string is only formatted once per distinct day, not per trade.
+    """
+    if not results:
+        return []
+    close_times = np.fromiter((r.close_time for r in results), dtype=np.int64, count=len(results))
+    days = close_times // _DAY_MS
+    # Stable sort keeps each day's trades in their original result order.
+    order = np.argsort(days, kind="stable")
+    unique_days, starts = np.unique(days[order], return_index=True)
+    ends = [*starts[1:].tolist(), len(order)]
 
     daily: list[DailyPnL] = []
-    for date_str in sorted(by_day):
-        trades = by_day[date_str]
+    for day, start, end in zip(unique_days.tolist(), starts.tolist(), ends, strict=True):
+        trades = [results[j] for j in order[start:end].tolist()]
         total = sum(t.weighted_pnl for t in trades)
         avg = total / len(trades)
         daily.append(
             DailyPnL(
-                date=date_str,
+                date=datetime.fromtimestamp(day * 86_400, tz=UTC).strftime("%Y-%m-%d"),
                 avg_weighted_pnl=avg,
                 trade_count=len(trades),
                 trades=tuple(trades),
@@ -1,23 +1,37 @@
 """Bulk download engine for kline data from data.binance.vision."""
 
-import csv
 import io
+import logging
+import re
+import threading
 import time
 import zipfile
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from xml.etree import ElementTree
+from typing import IO
 
 import httpx
+import numpy as np
+import pandas as pd
 
-from crypto_trade.models import Kline
+from crypto_trade.models import KlineBatch
+from crypto_trade.s3_listing import parse_listing
 from crypto_trade.storage import csv_path, read_last_open_time, write_klines
 
+log = logging.getLogger(__name__)
+
 S3_BUCKET_URL = "https://s3-ap-northeast-1.amazonaws.com/data.binance.vision"
-S3_NS = {"s3": "http://s3.amazonaws.com/doc/2006-03-01/"}
 
 MAX_RETRIES = 3
 RETRY_BACKOFF = 2.0
+ZIP_READ_BUFFER = 1 << 20  # 1 MiB
+DOWNLOAD_WORKERS = 8
+WRITE_BATCH_ARCHIVES = 12  # monthly archives merged per CSV append
+
+# Monthly archive filename: <SYMBOL>-<interval>-<YYYY>-<MM>.zip
+_KEY_RE = re.compile(r"(?:^|/)[^/]+-[^/]+-(\d{4})-(\d{2})\.zip$")
 
 
 @dataclass(frozen=True)
@@ -42,7 +56,32 @@ class BulkProgress:
     total_months: int = 0
     current_month: int = 0
     total_klines: int = 0
-    errors: int = 0
+    errors: int = 0  # failed archives plus dropped malformed rows
+
+
+class TokenBucket:
+    """Thread-safe limiter allowing one request per *interval* seconds.
+
+    A single-token bucket: acquire() reserves the next slot under a lock and
+    sleeps only for the part of the interval that hasn't already passed, so
+    time spent parsing or writing counts toward the pause and months that
+    are never requested cost nothing.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def acquire(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            time.sleep(wait)
 
 
 def list_monthly_archives(
@@ -65,28 +104,22 @@ def list_monthly_archives(
             params["marker"] = marker
 
         resp = _request_with_retry(http, S3_BUCKET_URL, params=params)
-        root = ElementTree.fromstring(resp.text)
+        page = parse_listing(resp.content)
 
-        for key_elem in root.findall(".//s3:Contents/s3:Key", S3_NS):
-            key = key_elem.text or ""
-            if key.endswith(".zip"):
-                archive = _parse_archive_key(key, symbol, interval, data_vision_base)
-                if archive:
-                    archives.append(archive)
+        for key in page.keys:
+            archive = _parse_archive_key(key, symbol, interval, data_vision_base)
+            if archive:
+                archives.append(archive)
 
-        is_truncated = root.findtext("s3:IsTruncated", namespaces=S3_NS)
-        if is_truncated != "true":
+        if not page.is_truncated:
             break
 
-        next_marker = root.findtext("s3:NextMarker", namespaces=S3_NS)
-        if next_marker:
-            marker = next_marker
+        if page.next_marker:
+            marker = page.next_marker
+        elif page.keys:
+            marker = page.keys[-1]
         else:
-            keys = [e.text or "" for e in root.findall(".//s3:Contents/s3:Key", S3_NS)]
-            if keys:
-                marker = keys[-1]
-            else:
-                break
+            break
 
     return sorted(archives, key=lambda a: (a.year, a.month))
 
@@ -94,24 +127,18 @@ def list_monthly_archives(
 def _parse_archive_key(
     key: str, symbol: str, interval: str, data_vision_base: str
 ) -> MonthlyArchive | None:
-    """Parse an S3 key into a MonthlyArchive."""
+    """Parse an S3 key into a MonthlyArchive, or None if it isn't a monthly ZIP."""
     # Key: data/futures/um/monthly/klines/BTCUSDT/1m/BTCUSDT-1m-2020-01.zip
-    filename = key.rsplit("/", 1)[-1]
-    # filename: BTCUSDT-1m-2020-01.zip
-    name = filename.removesuffix(".zip")
-    parts = name.split("-")
-    if len(parts) < 4:
-        return None
-    try:
-        year = int(parts[-2])
-        month = int(parts[-1])
-    except ValueError:
+    m = _KEY_RE.search(key)
+    if m is None:
         return None
     url = f"{data_vision_base}/{key}"
-    return MonthlyArchive(symbol=symbol, interval=interval, year=year, month=month, url=url)
+    return MonthlyArchive(
+        symbol=symbol, interval=interval, year=int(m[1]), month=int(m[2]), url=url
+    )
 
 
-def download_and_extract(http: httpx.Client, url: str) -> list[Kline]:
+def download_and_extract(http: httpx.Client, url: str) -> KlineBatch:
     """Download a ZIP archive and extract klines from the CSV inside."""
     resp = _request_with_retry(http, url)
     buf = io.BytesIO(resp.content)
@@ -119,18 +146,36 @@ def download_and_extract(http: httpx.Client, url: str) -> list[Kline]:
     with zipfile.ZipFile(buf) as zf:
         csv_names = [n for n in zf.namelist() if n.endswith(".csv")]
         if not csv_names:
-            return []
+            return KlineBatch.empty()
 
-        klines: list[Kline] = []
+        batches: list[KlineBatch] = []
         for csv_name in csv_names:
-            with zf.open(csv_name) as f:
-                text = io.TextIOWrapper(f, encoding="utf-8")
-                reader = csv.reader(text)
-                for row in reader:
-                    if len(row) >= 11 and row[0] != "open_time":
-                        klines.append(Kline.from_csv_row(row))
+            # Stream the entry through a large buffer so inflate runs in big
+            # chunks alongside parsing, instead of materialising the CSV.
+            with (
+                zf.open(csv_name) as raw,
+                io.BufferedReader(raw, buffer_size=ZIP_READ_BUFFER) as f,
+            ):
+                batches.append(_parse_kline_csv(f))
+
+    return KlineBatch.concat(batches)
 
-    return klines
+
+def _parse_kline_csv(f: IO[bytes]) -> KlineBatch:
+    """Parse a data.binance.vision kline CSV with pandas' C tokenizer.
+
+    Fields are read as strings (Kline keeps prices as text) and header rows
+    (post-2021 ZIPs include one) are dropped. Columns go straight into a
+    KlineBatch; bulk_fetch_symbol sanity-checks the rows (see
+    KlineBatch.drop_invalid). Non-numeric integer fields raise ValueError.
+    """
+    try:
+        df = pd.read_csv(f, header=None, dtype=str, na_filter=False, engine="c")
+    except pd.errors.EmptyDataError:
+        return KlineBatch.empty()
+    if df.shape[1] < 11:
+        return KlineBatch.empty()
+    return KlineBatch.from_frame(df[df[0] != "open_time"])
 
 
 def compute_missing_months(
@@ -175,10 +220,12 @@ def bulk_fetch_symbol(
     rate_pause: float = 0.1,
     progress_cb: Callable[[BulkProgress], None] | None = None,
     progress: BulkProgress | None = None,
+    max_workers: int = DOWNLOAD_WORKERS,
 ) -> int:
     """Download all available monthly archives for one symbol/interval.
 
-    Returns total kline count written.
+    Archives are fetched concurrently (up to *max_workers*) but written in
+    chronological order. Returns total kline count written.
     """
     archives = list_monthly_archives(http, data_vision_base, symbol, interval)
     missing = compute_missing_months(data_dir, symbol, interval, archives)
@@ -190,45 +237,117 @@ def bulk_fetch_symbol(
     last_time = read_last_open_time(path)
     total_written = 0
 
-    for i, archive in enumerate(missing):
+    pending: list[KlineBatch] = []
+
+    def flush() -> None:
+        nonlocal last_time, total_written
+        count, last_time = _append_new_klines(path, pending, last_time)
+        pending.clear()
+        total_written += count
         if progress:
-            progress.current_month = i + 1
-            if progress_cb:
-                progress_cb(progress)
-
-        try:
-            klines = download_and_extract(http, archive.url)
-        except (httpx.HTTPStatusError, zipfile.BadZipFile, ValueError) as exc:
-            if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 404:
-                continue
+            progress.total_klines += count
+
+    # Merge, dedup and append a year of archives at a time rather than paying
+    # a sort, mask and file write per month. The finally block writes the
+    # tail, and on an unexpected error keeps the months already downloaded.
+    downloads = _iter_downloads(http, missing, rate_pause, max_workers)
+    try:
+        for i, (archive, future) in enumerate(downloads):
             if progress:
-                progress.errors += 1
-            continue
+                progress.current_month = i + 1
+                if progress_cb:
+                    progress_cb(progress)
 
-        if not klines:
-            continue
+            try:
+                batch = future.result()
+            except (httpx.HTTPStatusError, zipfile.BadZipFile, ValueError) as exc:
+                not_found = (
+                    isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 404
+                )
+                if progress and not not_found:
+                    progress.errors += 1
+            else:
+                valid = batch.drop_invalid()
+                dropped = len(batch) - len(valid)
+                if dropped:
+                    log.warning("%s: dropped %d invalid rows from %s", symbol, dropped, archive.url)
+                    if progress:
+                        progress.errors += dropped
+                pending.append(valid)
+
+            if len(pending) >= WRITE_BATCH_ARCHIVES:
+                flush()
+    finally:
+        flush()
 
-        # Deduplicate: filter out klines we already have
-        if last_time is not None:
-            klines = [k for k in klines if k.open_time > last_time]
+    return total_written
 
-        if not klines:
-            continue
 
-        # Sort by open_time to ensure correct order
-        klines.sort(key=lambda k: k.open_time)
+def _append_new_klines(
+    path, batches: list[KlineBatch], last_time: int | None
+) -> tuple[int, int | None]:
+    """Append the rows of *batches* newer than *last_time* to the CSV.
 
-        append = path.exists()
-        count = write_klines(path, klines, append=append)
-        total_written += count
-        last_time = klines[-1].open_time
+    The batches are concatenated and sorted by open_time, and stale or
+    repeated rows are dropped in one pass. Returns the row count written
+    and the new last open_time.
+    """
+    klines = KlineBatch.concat(batches)
+    klines = klines.take(np.argsort(klines.open_time, kind="stable"))
+    klines = _newer_than(klines, last_time)
+    if not len(klines):
+        return 0, last_time
+    count = write_klines(path, klines, append=path.exists())
+    return count, int(klines.open_time[-1])
 
-        if progress:
-            progress.total_klines += count
 
-        time.sleep(rate_pause)
+def _newer_than(klines: KlineBatch, last_time: int | None) -> KlineBatch:
+    """Keep sorted klines whose open_time strictly advances past *last_time*.
 
-    return total_written
+    On sorted input this equals a running watermark: a row survives if it
+    is newer than the stored data and differs from its predecessor, which
+    drops both already-stored rows and duplicates inside the batch.
+    """
+    times = klines.open_time
+    keep = np.ones(len(times), dtype=bool)
+    keep[1:] = times[1:] != times[:-1]
+    if last_time is not None:
+        keep &= times > last_time
+    if keep.all():
+        return klines
+    return klines.take(keep)
+
+
+def _iter_downloads(
+    http: httpx.Client,
+    archives: list[MonthlyArchive],
+    rate_pause: float,
+    max_workers: int,
+) -> Iterator[tuple[MonthlyArchive, Future[KlineBatch]]]:
+    """Download archives on a thread pool, yielding futures in archive order.
+
+    At most *max_workers* archives are in flight or waiting to be consumed,
+    so downloads never run far ahead of the caller while CSV appends stay
+    chronological. The caller's own buffer is separate: bulk_fetch_symbol
+    keeps up to WRITE_BATCH_ARCHIVES parsed months before each write. Requests
+    are spaced at least *rate_pause* seconds apart by a shared TokenBucket.
+    """
+    bucket = TokenBucket(rate_pause)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending: deque[tuple[MonthlyArchive, Future[KlineBatch]]] = deque()
+        for archive in archives:
+            if len(pending) >= max_workers:
+                yield pending.popleft()
+            future = pool.submit(_throttled_download, bucket, http, archive.url)
+            pending.append((archive, future))
+        while pending:
+            yield pending.popleft()
+
+
+def _throttled_download(bucket: TokenBucket, http: httpx.Client, url: str) -> KlineBatch:
+    """Wait for a rate-limit slot, then download and parse one archive."""
+    bucket.acquire()
+    return download_and_extract(http, url)
 
 
 def bulk_fetch_all(
@@ -1,9 +1,26 @@
+import importlib.util
 import time
 
 import httpx
 
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json parses the same payloads
+    import json as _json
+
 from crypto_trade.models import Kline
 
+# Connection pool shared by the REST and bulk clients, so pages, symbols and
+# concurrent archive downloads reuse warm connections instead of handshaking.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+# HTTP/2 needs the optional h2 package (``httpx[http2]``).
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def make_http_client(**kwargs) -> httpx.Client:
+    """Create an httpx.Client with the shared pool limits (HTTP/2 when available)."""
+    return httpx.Client(http2=HTTP2, limits=HTTP_LIMITS, **kwargs)
+
 
 class BinanceClient:
     """HTTP client for the Binance Futures USD-M klines endpoint."""
@@ -19,6 +36,28 @@ class BinanceClient:
         self.limit = limit
         self.rate_limit_pause = rate_limit_pause
         self._transport = transport
+        self._http: httpx.Client | None = None
+
+    def __enter__(self) -> "BinanceClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection, if one was opened."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _client(self) -> httpx.Client:
+        """Return the persistent HTTP client, creating it on first use."""
+        if self._http is None:
+            client_kwargs: dict = {"base_url": self.base_url}
+            if self._transport is not None:
+                client_kwargs["transport"] = self._transport
+            self._http = make_http_client(**client_kwargs)
+        return self._http
 
     def fetch_klines(
         self,
@@ -35,36 +74,33 @@ class BinanceClient:
         all_klines: list[Kline] = []
         current_start = start_time
 
-        client_kwargs: dict = {"base_url": self.base_url}
-        if self._transport is not None:
-            client_kwargs["transport"] = self._transport
-        with httpx.Client(**client_kwargs) as http:
-            while True:
-                params: dict[str, str | int] = {
-                    "symbol": symbol,
-                    "interval": interval,
-                    "limit": self.limit,
-                }
-                if current_start is not None:
-                    params["startTime"] = current_start
-                if end_time is not None:
-                    params["endTime"] = end_time
-
-                resp = http.get("/fapi/v1/klines", params=params)
-                resp.raise_for_status()
-                raw_klines = resp.json()
-
-                if not raw_klines:
-                    break
-
-                batch = [Kline.from_api(row) for row in raw_klines]
-                all_klines.extend(batch)
-
-                if len(batch) < self.limit:
-                    break
-
-                # Advance past the last kline's open_time
-                current_start = batch[-1].open_time + 1
-                time.sleep(self.rate_limit_pause)
+        http = self._client()
+        while True:
+            params: dict[str, str | int] = {
+                "symbol": symbol,
+                "interval": interval,
+                "limit": self.limit,
+            }
+            if current_start is not None:
+                params["startTime"] = current_start
+            if end_time is not None:
+                params["endTime"] = end_time
+
+            resp = http.get("/fapi/v1/klines", params=params)
+            resp.raise_for_status()
+            raw_klines = _json.loads(resp.content)
+
+            if not raw_klines:
+                break
+
+            batch = [Kline.from_api(row) for row in raw_klines]
+            all_klines.extend(batch)
+
+            if len(batch) < self.limit:
+                break
+
+            # Advance past the last kline's open_time
+            current_start = batch[-1].open_time + 1
+            time.sleep(self.rate_limit_pause)
 
         return all_klines
@@ -1,5 +1,7 @@
 import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 # Fixed project-level constant — never changes between iterations.
@@ -28,12 +30,17 @@ class Settings:
 
 
 def _parse_tuple(value: str) -> tuple[str, ...]:
-    """Parse a comma-separated string into a tuple of stripped strings."""
-    return tuple(s.strip() for s in value.split(",") if s.strip())
+    """Parse a comma-separated string into a tuple of stripped, interned strings."""
+    return tuple(sys.intern(s.strip()) for s in value.split(",") if s.strip())
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load settings from environment variables."""
+    """Load settings from environment variables.
+
+    The result is cached for the life of the process; call
+    ``load_settings.cache_clear()`` after changing the environment.
+    """
     api_key = os.environ.get("BINANCE_API_KEY", "")
     api_secret = os.environ.get("BINANCE_API_SECRET", "")
 
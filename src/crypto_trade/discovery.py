@@ -1,13 +1,14 @@
 """Symbol discovery from Binance exchange info and data.binance.vision S3 bucket."""
 
+import sys
 from dataclasses import dataclass
-from xml.etree import ElementTree
 
 import httpx
 
+from crypto_trade.s3_listing import parse_listing
+
 S3_BUCKET_URL = "https://s3-ap-northeast-1.amazonaws.com/data.binance.vision"
 S3_PREFIX = "data/futures/um/monthly/klines/"
-S3_NS = {"s3": "http://s3.amazonaws.com/doc/2006-03-01/"}
 
 
 @dataclass(frozen=True)
@@ -26,7 +27,9 @@ def discover_from_exchange_info(base_url: str, http: httpx.Client) -> list[Symbo
     symbols = []
     for s in data.get("symbols", []):
         if s.get("contractType") == "PERPETUAL":
-            symbols.append(SymbolInfo(symbol=s["symbol"], status=s.get("status", "UNKNOWN")))
+            symbols.append(
+                SymbolInfo(symbol=sys.intern(s["symbol"]), status=s.get("status", "UNKNOWN"))
+            )
     return symbols
 
 
@@ -49,24 +52,21 @@ def discover_from_data_vision(http: httpx.Client) -> list[str]:
         resp = http.get(S3_BUCKET_URL, params=params)
         resp.raise_for_status()
 
-        root = ElementTree.fromstring(resp.text)
+        page = parse_listing(resp.content)
 
-        for prefix_elem in root.findall(".//s3:CommonPrefixes/s3:Prefix", S3_NS):
-            prefix_text = prefix_elem.text or ""
+        for prefix_text in page.prefixes:
             # prefix looks like "data/futures/um/monthly/klines/BTCUSDT/"
             parts = prefix_text.rstrip("/").split("/")
             if parts:
-                symbols.append(parts[-1])
+                symbols.append(sys.intern(parts[-1]))
 
         # Check if there are more results
-        is_truncated = root.findtext("s3:IsTruncated", namespaces=S3_NS)
-        if is_truncated != "true":
+        if not page.is_truncated:
             break
 
         # Get the last prefix as the next marker
-        next_marker = root.findtext("s3:NextMarker", namespaces=S3_NS)
-        if next_marker:
-            marker = next_marker
+        if page.next_marker:
+            marker = page.next_marker
         elif symbols:
             marker = S3_PREFIX + symbols[-1] + "/"
         else:
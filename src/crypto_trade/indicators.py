@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 
+from crypto_trade._njit import njit
+
 
 @dataclass(frozen=True)
 class BollingerBands:
@@ -29,10 +32,17 @@ def ema(values: np.ndarray, period: int) -> float | None:
     """
     if len(values) < period or period <= 0:
         return None
+    values = np.asarray(values, dtype=np.float64)
+    seed = float(values[:period].mean())
+    return float(_ema_kernel(values, period, seed))
+
+
+@njit(cache=True, nogil=True)
+def _ema_kernel(values: np.ndarray, period: int, seed: float) -> float:
     k = 2.0 / (period + 1)
-    result = float(values[:period].mean())
-    for v in values[period:]:
-        result = float(v) * k + result * (1.0 - k)
+    result = seed
+    for i in range(period, len(values)):
+        result = values[i] * k + result * (1.0 - k)
     return result
 
 
@@ -43,14 +53,80 @@ def stddev(values: np.ndarray, period: int) -> float | None:
     return float(values[-period:].std(ddof=0))
 
 
+def rolling_mean_std(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and population std over *window* values, in one O(n) pass.
+
+    Uses Welford's update for the incoming value and West's deletion update
+    for the value leaving the window. Positions before the first full window,
+    and windows holding a NaN or inf, are NaN, matching
+    ``Series.rolling(window, min_periods=window)``. Non-finite values are kept
+    out of the running state, so output recovers once they leave the window.
+    """
+    return _rolling_mean_std_kernel(np.asarray(values, dtype=np.float64), window)
+
+
+def rolling_mean_std_by(
+    values: pd.Series, groups: pd.Series, window: int
+) -> tuple[pd.Series, pd.Series]:
+    """rolling_mean_std applied within each group, aligned to *values*."""
+    arr = values.to_numpy(dtype=np.float64)
+    mean = np.full(len(arr), np.nan)
+    std = np.full(len(arr), np.nan)
+    for idx in groups.groupby(groups, sort=False, observed=True).indices.values():
+        mean[idx], std[idx] = _rolling_mean_std_kernel(arr[idx], window)
+    return pd.Series(mean, index=values.index), pd.Series(std, index=values.index)
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_std_kernel(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    n = len(values)
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+    mean = 0.0
+    m2 = 0.0
+    count = 0  # finite values held in mean/m2
+    bad = 0  # NaN/inf values in the window; they never enter mean/m2
+    for i in range(n):
+        if i >= window:
+            y = values[i - window]
+            if not np.isfinite(y):
+                bad -= 1
+            else:
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = y - mean
+                    mean -= delta / count
+                    m2 -= delta * (y - mean)
+        x = values[i]
+        if not np.isfinite(x):
+            bad += 1
+        else:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        if count == window:
+            mean_out[i] = mean
+            std_out[i] = np.sqrt(m2 / count) if m2 > 0.0 else 0.0
+    return mean_out, std_out
+
+
 def bollinger_bands(
     closes: np.ndarray, period: int = 20, num_std: float = 2.0
 ) -> BollingerBands | None:
     """Bollinger Bands: middle=SMA, upper/lower=middle +/- num_std*stddev."""
-    middle = sma(closes, period)
-    sd = stddev(closes, period)
-    if middle is None or sd is None:
+    if len(closes) < period or period <= 0:
         return None
+    # One slice and one mean shared by both statistics; same arithmetic as
+    # sma() followed by stddev() (ndarray.std recomputes the mean).
+    window = np.asarray(closes[-period:], dtype=np.float64)
+    mean = window.mean()
+    dev = window - mean
+    middle = float(mean)
+    sd = math.sqrt(float((dev * dev).sum()) / period)
     upper = middle + num_std * sd
     lower = middle - num_std * sd
     bandwidth = (upper - lower) / middle if middle != 0 else 0.0
@@ -65,33 +141,26 @@ def true_range(high: float, low: float, prev_close: float) -> float:
 def atr(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> float | None:
     """Average true range (SMA of true ranges over *period*)."""
     n = len(highs)
-    if n < period + 1 or len(lows) < period + 1 or len(closes) < period + 1:
+    if n < period + 1 or len(lows) < period + 1 or len(closes) < period + 1 or period <= 0:
         return None
-    # Vectorized true range: max(high-low, |high-prev_close|, |low-prev_close|)
-    h = highs[1:]
-    lo = lows[1:]
-    pc = closes[:-1]
+    # Vectorized true range: max(high-low, |high-prev_close|, |low-prev_close|),
+    # over the last *period* bars only -- earlier ranges never reach the mean.
+    h = np.asarray(highs[-period:], dtype=np.float64)
+    lo = np.asarray(lows[-period:], dtype=np.float64)
+    pc = np.asarray(closes[-period - 1 : -1], dtype=np.float64)
     tr = np.maximum(h - lo, np.maximum(np.abs(h - pc), np.abs(lo - pc)))
-    return sma(tr, period)
+    return float(tr.mean())
 
 
 def rsi(closes: np.ndarray, period: int = 14) -> float | None:
     """Relative Strength Index using Wilder's smoothing (EMA-style)."""
     if len(closes) < period + 1 or period <= 0:
         return None
-    deltas = np.diff(closes)
+    deltas = np.diff(np.asarray(closes, dtype=np.float64))
 
     gains = np.where(deltas[:period] > 0, deltas[:period], 0.0)
     losses = np.where(deltas[:period] < 0, -deltas[:period], 0.0)
-    avg_gain = float(gains.mean())
-    avg_loss = float(losses.mean())
-
-    for d in deltas[period:]:
-        d = float(d)
-        gain = d if d > 0 else 0.0
-        loss = -d if d < 0 else 0.0
-        avg_gain = (avg_gain * (period - 1) + gain) / period
-        avg_loss = (avg_loss * (period - 1) + loss) / period
+    avg_gain, avg_loss = _wilder_kernel(deltas, period, float(gains.mean()), float(losses.mean()))
 
     if avg_loss == 0:
         return 100.0
@@ -99,12 +168,50 @@ def rsi(closes: np.ndarray, period: int = 14) -> float | None:
     return 100.0 - 100.0 / (1.0 + rs)
 
 
+@njit(cache=True, nogil=True)
+def _wilder_kernel(
+    deltas: np.ndarray, period: int, avg_gain: float, avg_loss: float
+) -> tuple[float, float]:
+    """Wilder-smooth average gain/loss over deltas[period:] from their seeds."""
+    for i in range(period, len(deltas)):
+        d = deltas[i]
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+    return avg_gain, avg_loss
+
+
 def rsi_series(closes: pd.Series, period: int = 14) -> pd.Series:
-    """Vectorized RSI using pandas ewm for Wilder's smoothing."""
-    delta = closes.diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = (-delta).where(delta < 0, 0.0)
-    avg_gain = gain.ewm(com=period - 1, min_periods=period, adjust=False).mean()
-    avg_loss = loss.ewm(com=period - 1, min_periods=period, adjust=False).mean()
-    rs = avg_gain / avg_loss
-    return 100.0 - 100.0 / (1.0 + rs)
+    """Vectorized RSI with Wilder's smoothing, one pass over the closes.
+
+    Matches ``ewm(com=period - 1, min_periods=period, adjust=False)`` on the
+    gain/loss series, seeded from the first (zero) delta.
+    """
+    values = closes.to_numpy(dtype=np.float64)
+    return pd.Series(_rsi_series_kernel(values, period), index=closes.index)
+
+
+@njit(cache=True, nogil=True)
+def _rsi_series_kernel(closes: np.ndarray, period: int) -> np.ndarray:
+    """RSI at every bar; NaN until ``period`` deltas have been seen."""
+    n = len(closes)
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period
+    keep = 1.0 - alpha
+    norm = keep + alpha
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        d = closes[i] - closes[i - 1]
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        avg_gain = (keep * avg_gain + alpha * gain) / norm
+        avg_loss = (keep * avg_loss + alpha * loss) / norm
+        if i < period - 1:
+            continue
+        if avg_loss != 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain != 0:
+            out[i] = 100.0
+    return out
@@ -5,6 +5,8 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from crypto_trade.storage import parquet_path, write_kline_frame_parquet
+
 # Column schema: name → dtype
 _COLUMNS = {
     "open_time": np.int64,
@@ -20,6 +22,10 @@ _COLUMNS = {
     "taker_buy_quote_volume": np.float64,
 }
 
+# Schema-metadata key holding the "<size>:<mtime_ns>" of the CSV a Parquet
+# snapshot was built from.
+_STAMP_KEY = "crypto_trade.source"
+
 
 class KlineArray:
     """Columnar kline storage backed by a pandas DataFrame with DatetimeIndex.
@@ -161,36 +167,67 @@ class KlineArray:
         return KlineArray(self._df.iloc[start:end])
 
     def time_slice(self, start_ms: int | None = None, end_ms: int | None = None) -> KlineArray:
-        """Slice by epoch-ms timestamps using the DatetimeIndex."""
-        start_ts = pd.Timestamp(start_ms, unit="ms", tz="UTC") if start_ms is not None else None
-        end_ts = pd.Timestamp(end_ms, unit="ms", tz="UTC") if end_ms is not None else None
-        return KlineArray(self._df.loc[start_ts:end_ts])
-
-
-def load_kline_array(path: Path) -> KlineArray:
-    """Load a CSV file into a DataFrame-backed KlineArray."""
+        """Slice rows with start_ms <= open_time <= end_ms (either bound optional).
+
+        Rows are sorted by open_time, so both bounds are found by binary
+        search on the int64 column and the result is a positional slice.
+        """
+        open_time = self._df["open_time"].to_numpy()
+        lo = int(np.searchsorted(open_time, start_ms, "left")) if start_ms is not None else 0
+        hi = int(np.searchsorted(open_time, end_ms, "right")) if end_ms is not None else None
+        return KlineArray(self._df.iloc[lo:hi])
+
+
+def load_kline_array(path: Path, snapshot: bool = False) -> KlineArray:
+    """Load a kline CSV into a DataFrame-backed KlineArray.
+
+    With *snapshot*, the first load of a CSV also writes a Parquet snapshot
+    next to it (see storage.parquet_path), stamped with the CSV's size and
+    mtime. Later snapshot loads read it instead of re-parsing the text for
+    as long as the CSV is unchanged; any append invalidates it. Leave it off
+    for CSVs that are appended to between loads (the live engine), where the
+    snapshot would be rewritten on every call and never hit.
+    """
     if not path.exists():
         return KlineArray.empty()
 
-    df = pd.read_csv(
-        path,
-        dtype={
-            "open_time": np.int64,
-            "open": np.float64,
-            "high": np.float64,
-            "low": np.float64,
-            "close": np.float64,
-            "volume": np.float64,
-            "close_time": np.int64,
-            "quote_volume": np.float64,
-            "trades": np.int64,
-            "taker_buy_volume": np.float64,
-            "taker_buy_quote_volume": np.float64,
-        },
-    )
+    df = _load_via_snapshot(path) if snapshot else pd.read_csv(path, dtype=_COLUMNS)
 
     if df.empty:
         return KlineArray.empty()
 
     df.index = pd.to_datetime(df["open_time"], unit="ms", utc=True)
     return KlineArray(df)
+
+
+def _load_via_snapshot(path: Path) -> pd.DataFrame:
+    """Read *path*'s Parquet snapshot if current, else parse and rewrite it."""
+    snapshot = parquet_path(path)
+    stamp = _source_stamp(path)
+    if _snapshot_stamp(snapshot) == stamp:
+        return pd.read_parquet(snapshot, memory_map=True)
+    df = pd.read_csv(path, dtype=_COLUMNS)
+    if not df.empty:
+        try:
+            write_kline_frame_parquet(snapshot, df, {_STAMP_KEY: stamp})
+        except OSError:
+            pass  # read-only data dir: keep working from the CSV
+    return df
+
+
+def _source_stamp(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _snapshot_stamp(snapshot: Path) -> str | None:
+    """Return the source stamp recorded in a Parquet snapshot, if any."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_schema(snapshot).metadata or {}
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None
+    value = metadata.get(_STAMP_KEY.encode())
+    return value.decode() if value is not None else None
@@ -1287,3 +1287,5 @@ class LiveEngine:
         self._state.close()
         if self._auth_client:
             self._auth_client.close()
+        self._read_client.close()
+        self._fetch_client.close()
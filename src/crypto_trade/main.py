@@ -2,10 +2,8 @@ import argparse
 import sys
 from datetime import UTC, datetime
 
-import httpx
-
 from crypto_trade.bulk import BulkProgress, bulk_fetch_all
-from crypto_trade.client import BinanceClient
+from crypto_trade.client import BinanceClient, make_http_client
 from crypto_trade.config import load_settings
 from crypto_trade.discovery import (
     discover_from_data_vision,
@@ -384,7 +382,7 @@ def main() -> None:
 
 def _cmd_fetch(args, settings) -> None:
     if getattr(args, "all", False):
-        with httpx.Client() as http:
+        with make_http_client() as http:
             api_symbols = discover_from_exchange_info(settings.base_url, http)
         symbols = tuple(s.symbol for s in api_symbols if not is_stablecoin_pair(s.symbol))
         print(f"Discovered {len(symbols)} active perpetual symbols")
@@ -400,17 +398,16 @@ def _cmd_fetch(args, settings) -> None:
     )
     start_time = _parse_date(args.start) if args.start else None
 
-    client = BinanceClient(
-        base_url=settings.base_url,
-        limit=settings.kline_limit,
-        rate_limit_pause=settings.rate_limit_pause,
-    )
-
     print(f"Fetching klines for {len(symbols)} symbols @ {intervals}")
     if start_time:
         print(f"Starting from {args.start}")
 
-    results = fetch_all(client, settings.data_dir, symbols, intervals, start_time)
+    with BinanceClient(
+        base_url=settings.base_url,
+        limit=settings.kline_limit,
+        rate_limit_pause=settings.rate_limit_pause,
+    ) as client:
+        results = fetch_all(client, settings.data_dir, symbols, intervals, start_time)
     for key, count in results.items():
         print(f"  {key}: {count} klines")
     total = sum(results.values())
@@ -420,7 +417,7 @@ def _cmd_fetch(args, settings) -> None:
 def _cmd_symbols(args, settings) -> None:
     source = args.source
 
-    with httpx.Client() as http:
+    with make_http_client() as http:
         if source == "api":
             symbols = discover_from_exchange_info(settings.base_url, http)
             for s in symbols:
@@ -449,7 +446,7 @@ def _cmd_bulk(args, settings) -> None:
 
     intervals = [i.strip() for i in args.intervals.split(",")]
 
-    with httpx.Client(timeout=60.0) as http:
+    with make_http_client(timeout=60.0) as http:
         if args.all_symbols:
             print("Discovering symbols from data.binance.vision...")
             symbols = [
@@ -479,18 +476,18 @@ def _cmd_bulk(args, settings) -> None:
 
     if args.api_backfill:
         print("\nBackfilling current month from API...")
-        client = BinanceClient(
+        backfill_total = 0
+        with BinanceClient(
             base_url=settings.base_url,
             limit=settings.kline_limit,
             rate_limit_pause=settings.rate_limit_pause,
-        )
-        backfill_total = 0
-        for symbol in symbols:
-            for interval in intervals:
-                count = fetch_symbol_interval(client, settings.data_dir, symbol, interval)
-                if count:
-                    print(f"  {symbol}/{interval}: {count} klines backfilled")
-                    backfill_total += count
+        ) as client:
+            for symbol in symbols:
+                for interval in intervals:
+                    count = fetch_symbol_interval(client, settings.data_dir, symbol, interval)
+                    if count:
+                        print(f"  {symbol}/{interval}: {count} klines backfilled")
+                        backfill_total += count
         print(f"API backfill complete — {backfill_total:,} klines")
 
 
@@ -1,7 +1,14 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Kline:
     """A single candlestick (kline) from Binance Futures."""
 
@@ -17,7 +24,7 @@ class Kline:
     taker_buy_volume: str
     taker_buy_quote_volume: str
 
-    CSV_HEADER: tuple[str, ...] = (
+    CSV_HEADER: ClassVar[tuple[str, ...]] = (
         "open_time",
         "open",
         "high",
@@ -32,28 +39,30 @@ class Kline:
     )
 
     @classmethod
-    def from_api(cls, raw: list) -> "Kline":
+    def from_api(cls, raw: list) -> Kline:
         """Parse a kline from the Binance API response array.
 
         Binance returns 12 elements per kline; we use the first 11
         (index 11 is an unused "ignore" field).
         """
+        # Positional construction skips kwargs matching in the generated
+        # __init__; argument order is the field order (== CSV_HEADER).
         return cls(
-            open_time=int(raw[0]),
-            open=str(raw[1]),
-            high=str(raw[2]),
-            low=str(raw[3]),
-            close=str(raw[4]),
-            volume=str(raw[5]),
-            close_time=int(raw[6]),
-            quote_volume=str(raw[7]),
-            trades=int(raw[8]),
-            taker_buy_volume=str(raw[9]),
-            taker_buy_quote_volume=str(raw[10]),
+            int(raw[0]),
+            str(raw[1]),
+            str(raw[2]),
+            str(raw[3]),
+            str(raw[4]),
+            str(raw[5]),
+            int(raw[6]),
+            str(raw[7]),
+            int(raw[8]),
+            str(raw[9]),
+            str(raw[10]),
         )
 
     @classmethod
-    def from_csv_row(cls, row: list[str]) -> "Kline":
+    def from_csv_row(cls, row: list[str]) -> Kline:
         """Parse a kline from a CSV row (list of strings).
 
         Used to read CSVs from data.binance.vision ZIPs.
@@ -61,17 +70,39 @@ class Kline:
         Callers must skip header rows (post-2021 ZIPs include one).
         """
         return cls(
-            open_time=int(row[0]),
-            open=row[1],
-            high=row[2],
-            low=row[3],
-            close=row[4],
-            volume=row[5],
-            close_time=int(row[6]),
-            quote_volume=row[7],
-            trades=int(row[8]),
-            taker_buy_volume=row[9],
-            taker_buy_quote_volume=row[10],
+            int(row[0]),
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            row[5],
+            int(row[6]),
+            row[7],
+            int(row[8]),
+            row[9],
+            row[10],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        # Hand-written so identical objects short-circuit and the int fields,
+        # which differ between any two distinct bars, are compared first.
+        # dataclass keeps this __eq__ and still generates the matching __hash__.
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.open_time == other.open_time
+            and self.close_time == other.close_time
+            and self.trades == other.trades
+            and self.open == other.open
+            and self.high == other.high
+            and self.low == other.low
+            and self.close == other.close
+            and self.volume == other.volume
+            and self.quote_volume == other.quote_volume
+            and self.taker_buy_volume == other.taker_buy_volume
+            and self.taker_buy_quote_volume == other.taker_buy_quote_volume
         )
 
     def to_row(self) -> list[str]:
@@ -89,3 +120,119 @@ class Kline:
             self.taker_buy_volume,
             self.taker_buy_quote_volume,
         ]
+
+
+# Integer columns of a KlineBatch; the rest stay as exchange-formatted strings.
+_BATCH_INT_COLUMNS = ("open_time", "close_time", "trades")
+
+
+class KlineBatch:
+    """Columnar (struct-of-arrays) batch of klines backed by a DataFrame.
+
+    Integer fields are int64 columns and price/volume fields keep the
+    exchange's string formatting, exactly as in Kline, so a batch round-trips
+    through CSV unchanged. Bulk parsing builds one of these per archive
+    instead of one Kline object per row; indexing with an int still returns
+    a Kline for callers that want a single row.
+    """
+
+    __slots__ = ("_df",)
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self._df = df
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> KlineBatch:
+        """Build a batch from the first 11 columns of a string-typed frame.
+
+        Raises ValueError if an integer column holds non-numeric text.
+        """
+        cols = {}
+        for pos, name in enumerate(Kline.CSV_HEADER):
+            col = df.iloc[:, pos]
+            if name in _BATCH_INT_COLUMNS:
+                cols[name] = col.to_numpy().astype(np.int64)
+            else:
+                cols[name] = col.to_numpy(dtype=object)
+        return cls(pd.DataFrame(cols))
+
+    @classmethod
+    def from_klines(cls, klines: Sequence[Kline]) -> KlineBatch:
+        """Build a batch from Kline objects."""
+        if not klines:
+            return cls.empty()
+        return cls.from_frame(pd.DataFrame([k.to_row() for k in klines]))
+
+    @classmethod
+    def empty(cls) -> KlineBatch:
+        """Return an empty batch with the correct schema."""
+        return cls(
+            pd.DataFrame(
+                {
+                    name: np.empty(0, dtype=np.int64 if name in _BATCH_INT_COLUMNS else object)
+                    for name in Kline.CSV_HEADER
+                }
+            )
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence[KlineBatch]) -> KlineBatch:
+        """Concatenate batches in order."""
+        frames = [b._df for b in batches if len(b)]
+        if not frames:
+            return cls.empty()
+        if len(frames) == 1:
+            return cls(frames[0])
+        return cls(pd.concat(frames, ignore_index=True))
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    @property
+    def open_time(self) -> np.ndarray:
+        return self._df["open_time"].to_numpy()
+
+    @property
+    def close_time(self) -> np.ndarray:
+        return self._df["close_time"].to_numpy()
+
+    def drop_invalid(self) -> KlineBatch:
+        """Return the batch without rows that fail the sanity checks.
+
+        Rows need a positive open_time, a close_time after it and a
+        non-negative trade count. Dropping only the offending rows keeps the
+        rest of an archive, so one bad line never leaves a month-long gap;
+        callers compare lengths to report how many were dropped.
+        """
+        open_time = self.open_time
+        bad = (
+            (open_time <= 0) | (self.close_time <= open_time) | (self._df["trades"].to_numpy() < 0)
+        )
+        if not bad.any():
+            return self
+        return self.take(~bad)
+
+    def take(self, indexer: np.ndarray) -> KlineBatch:
+        """Return the rows selected by a positional index or boolean mask."""
+        return KlineBatch(self._df.iloc[indexer].reset_index(drop=True))
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def __getitem__(self, i: int) -> Kline:
+        if i < 0:
+            i += len(self._df)
+        if not 0 <= i < len(self._df):
+            raise IndexError("KlineBatch index out of range")
+        return next(self._iter_rows(i, i + 1))
+
+    def __iter__(self) -> Iterator[Kline]:
+        return self._iter_rows(0, len(self._df))
+
+    def _iter_rows(self, start: int, stop: int) -> Iterator[Kline]:
+        # tolist() turns int64 columns into Python ints; itertuples would
+        # leak numpy.int64 into the int fields.
+        part = self._df.iloc[start:stop]
+        columns = [part[name].tolist() for name in Kline.CSV_HEADER]
+        return (Kline(*row) for row in zip(*columns, strict=True))
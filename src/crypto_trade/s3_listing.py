@@ -0,0 +1,47 @@
+"""Streaming parser for S3 ListBucketResult pages (data.binance.vision)."""
+
+import io
+from dataclasses import dataclass, field
+from xml.etree import ElementTree
+
+_NS = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+_CONTENTS = _NS + "Contents"
+_COMMON_PREFIXES = _NS + "CommonPrefixes"
+_KEY = _NS + "Key"
+_PREFIX = _NS + "Prefix"
+_IS_TRUNCATED = _NS + "IsTruncated"
+_NEXT_MARKER = _NS + "NextMarker"
+
+
+@dataclass
+class ListingPage:
+    """The parts of one ListBucketResult page that callers paginate on."""
+
+    keys: list[str] = field(default_factory=list)
+    prefixes: list[str] = field(default_factory=list)
+    is_truncated: bool = False
+    next_marker: str | None = None
+
+
+def parse_listing(content: bytes) -> ListingPage:
+    """Parse a ListBucketResult page with iterparse.
+
+    Each <Contents>/<CommonPrefixes> entry is read and cleared as soon as it
+    closes. The emptied elements stay attached to the root, so the tree
+    still grows by one bare node per entry, but their Key/Prefix children
+    and text are freed.
+    """
+    page = ListingPage()
+    for _, elem in ElementTree.iterparse(io.BytesIO(content), events=("end",)):
+        tag = elem.tag
+        if tag == _CONTENTS:
+            page.keys.append(elem.findtext(_KEY) or "")
+            elem.clear()
+        elif tag == _COMMON_PREFIXES:
+            page.prefixes.append(elem.findtext(_PREFIX) or "")
+            elem.clear()
+        elif tag == _IS_TRUNCATED:
+            page.is_truncated = elem.text == "true"
+        elif tag == _NEXT_MARKER:
+            page.next_marker = elem.text or None
+    return page
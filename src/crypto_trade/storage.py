@@ -1,49 +1,82 @@
-import csv
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
-from crypto_trade.models import Kline
+import pandas as pd
 
+from crypto_trade.models import Kline, KlineBatch
 
+_TAIL_BLOCK = 4096
+
+
+@lru_cache(maxsize=1024)
 def csv_path(data_dir: Path, symbol: str, interval: str) -> Path:
-    """Return the CSV file path for a given symbol and interval."""
+    """Return the CSV file path for a given symbol and interval.
+
+    Cached: ingestion, backtests and the live engine resolve the same few
+    paths over and over, and Path objects are immutable.
+    """
     return data_dir / symbol / f"{interval}.csv"
 
 
+def parquet_path(csv_file: Path) -> Path:
+    """Return the Parquet snapshot path that sits next to a kline CSV."""
+    return csv_file.with_suffix(".parquet")
+
+
 def read_last_open_time(path: Path) -> int | None:
     """Read the open_time of the last row in a CSV file.
 
+    Only the tail of the file is read: rows are appended in open_time order,
+    so the last non-empty line is the newest kline. The tail block doubles
+    until it holds a complete line, so cost is independent of file size.
+
     Returns None if the file doesn't exist or is empty (header-only).
     """
     if not path.exists():
         return None
-    with open(path, newline="") as f:
-        reader = csv.reader(f)
-        next(reader, None)  # skip header
-        last_row = None
-        for row in reader:
-            last_row = row
-    if last_row is None:
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        block = _TAIL_BLOCK
+        while True:
+            start = max(0, size - block)
+            f.seek(start)
+            lines = [ln for ln in f.read().splitlines() if ln.strip()]
+            # The first line of a mid-file block may be partial; stop once a
+            # complete last line is guaranteed.
+            if start == 0 or len(lines) >= 2:
+                break
+            block *= 2
+    if not lines or lines[-1].startswith(b"open_time"):
         return None
-    return int(last_row[0])
+    return int(lines[-1].split(b",", 1)[0])
 
 
-def write_klines(path: Path, klines: list[Kline], *, append: bool = False) -> int:
+def write_klines(path: Path, klines: list[Kline] | KlineBatch, *, append: bool = False) -> int:
     """Write klines to a CSV file.
 
     When append=True, opens in append mode and skips the header.
+    A KlineBatch is written column-wise by pandas' C writer.
     Returns the number of rows written.
     """
-    if not klines:
+    if not len(klines):
         return 0
     path.parent.mkdir(parents=True, exist_ok=True)
     mode = "a" if append else "w"
     write_header = not append
-    with open(path, mode, newline="") as f:
-        writer = csv.writer(f)
-        if write_header:
-            writer.writerow(Kline.CSV_HEADER)
-        for kline in klines:
-            writer.writerow(kline.to_row())
+    if isinstance(klines, KlineBatch):
+        # Same \r\n terminator as the row path below, so appends stay uniform.
+        klines.df.to_csv(path, mode=mode, header=write_header, index=False, lineterminator="\r\n")
+        return len(klines)
+    # Rows are plain numbers and decimal strings (never quoted), so joining
+    # them directly matches csv.writer's output, \r\n terminator included.
+    lines = [",".join(k.to_row()) for k in klines]
+    if write_header:
+        lines.insert(0, ",".join(Kline.CSV_HEADER))
+    lines.append("")
+    with open(path, mode + "b") as f:
+        f.write("\r\n".join(lines).encode("ascii"))
     return len(klines)
 
 
@@ -51,24 +84,51 @@ def read_klines(path: Path) -> list[Kline]:
     """Read all klines from a CSV file."""
     if not path.exists():
         return []
-    klines: list[Kline] = []
-    with open(path, newline="") as f:
-        reader = csv.reader(f)
-        next(reader, None)  # skip header
-        for row in reader:
-            klines.append(
-                Kline(
-                    open_time=int(row[0]),
-                    open=row[1],
-                    high=row[2],
-                    low=row[3],
-                    close=row[4],
-                    volume=row[5],
-                    close_time=int(row[6]),
-                    quote_volume=row[7],
-                    trades=int(row[8]),
-                    taker_buy_volume=row[9],
-                    taker_buy_quote_volume=row[10],
-                )
-            )
-    return klines
+    lines = path.read_bytes().splitlines()[1:]  # skip header
+    return [Kline.from_csv_row(line.decode("ascii").split(",")) for line in lines if line]
+
+
+def read_kline_batch(path: Path) -> KlineBatch:
+    """Read a kline CSV column-wise into a KlineBatch.
+
+    The file is tokenized once by pandas' C reader; Kline objects are only
+    built when rows are indexed or iterated, so callers that want columns
+    (e.g. ``batch.df["close"]``) never pay for them.
+    """
+    if not path.exists():
+        return KlineBatch.empty()
+    try:
+        df = pd.read_csv(path, dtype=str, na_filter=False, engine="c")
+    except pd.errors.EmptyDataError:
+        return KlineBatch.empty()
+    if df.empty:
+        return KlineBatch.empty()
+    return KlineBatch.from_frame(df)
+
+
+def write_kline_frame_parquet(
+    path: Path, df: pd.DataFrame, metadata: dict[str, str] | None = None
+) -> None:
+    """Atomically write a numeric kline DataFrame to Parquet (Snappy).
+
+    *metadata* is merged into the file's schema metadata.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata:
+        merged = dict(table.schema.metadata or {})
+        merged.update({k.encode(): v.encode() for k, v in metadata.items()})
+        table = table.replace_schema_metadata(merged)
+    # A unique temp file per writer: concurrent backtests snapshotting the
+    # same CSV must never replace the target with each other's partial file.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
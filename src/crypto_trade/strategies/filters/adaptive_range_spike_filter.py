@@ -29,6 +29,7 @@ import pandas as pd
 
 from crypto_trade.backtest_models import Signal, Strategy
 from crypto_trade.strategies import NO_SIGNAL
+from crypto_trade.strategies.filters.range_spike_filter import range_spike
 
 # ---------------------------------------------------------------------------
 # CalibrationResult — audit trail for each recalibration
@@ -167,14 +168,7 @@ class AdaptiveRangeSpikeFilter:
             self.inner.compute_features(master)
 
         # Compute range spike for all data (grouped by symbol)
-        range_ratio = (master["high"] - master["low"]) / master["open"]
-        rolling_mean = range_ratio.groupby(master["symbol"]).transform(
-            lambda x: x.rolling(self.window, min_periods=self.window).mean()
-        )
-        range_spike = range_ratio / rolling_mean.replace(0.0, float("nan"))
-
-        del range_ratio, rolling_mean
-        self._spikes = range_spike.values
+        self._spikes = range_spike(master, self.window)
         self._open_times = master["open_time"].values
         self._n_symbols = master["symbol"].nunique()
         self._pos = 0
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from crypto_trade.backtest_models import Signal, Strategy
+from crypto_trade.indicators import rolling_mean_std_by
 from crypto_trade.strategies import NO_SIGNAL
 
 
+def range_spike(master: pd.DataFrame, window: int) -> np.ndarray:
+    """Per-row range_ratio / rolling mean of range_ratio, within each symbol.
+
+    Element-wise steps run on the raw float64 columns (no Series index
+    alignment). NaN during each symbol's warmup and where the mean is zero.
+    """
+    high = master["high"].to_numpy(dtype=np.float64)
+    low = master["low"].to_numpy(dtype=np.float64)
+    opens = master["open"].to_numpy(dtype=np.float64)
+    range_ratio = (high - low) / opens
+    rolling_mean, _ = rolling_mean_std_by(
+        pd.Series(range_ratio, index=master.index), master["symbol"], window
+    )
+    mean = rolling_mean.to_numpy()
+    return np.divide(range_ratio, mean, out=np.full_like(mean, np.nan), where=mean != 0.0)
+
+
 class RangeSpikeFilter:
     """Pass-through filter: only forwards inner strategy signals when range_spike >= threshold.
 
@@ -28,13 +47,7 @@ class RangeSpikeFilter:
         if self.inner is not None:
             self.inner.compute_features(master)
 
-        range_ratio = (master["high"] - master["low"]) / master["open"]
-        rolling_mean = range_ratio.groupby(master["symbol"]).transform(
-            lambda x: x.rolling(self.window, min_periods=self.window).mean()
-        )
-        range_spike = range_ratio / rolling_mean.replace(0.0, float("nan"))
-
-        self._passes = (range_spike >= self.threshold).values
+        self._passes = range_spike(master, self.window) >= self.threshold
         self._pos = 0
 
     def skip(self) -> None:
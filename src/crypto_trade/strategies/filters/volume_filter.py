@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from crypto_trade.backtest_models import Signal, Strategy
+from crypto_trade.indicators import rolling_mean_std_by
 from crypto_trade.strategies import NO_SIGNAL
 
 
@@ -24,10 +26,8 @@ class VolumeFilter:
             self.inner.compute_features(master)
 
         vol = master["volume"]
-        vol_avg = vol.groupby(master["symbol"]).transform(
-            lambda x: x.rolling(self.lookback, min_periods=self.lookback).mean()
-        )
-        self._passes = (vol > self.multiplier * vol_avg).values
+        vol_avg, _ = rolling_mean_std_by(vol, master["symbol"], self.lookback)
+        self._passes = vol.to_numpy(dtype=np.float64) > self.multiplier * vol_avg.to_numpy()
         self._pos = 0
 
     def skip(self) -> None:
@@ -3,8 +3,12 @@ from __future__ import annotations
 import pandas as pd
 
 from crypto_trade.backtest_models import Signal
+from crypto_trade.indicators import rolling_mean_std_by
 from crypto_trade.strategies import NO_SIGNAL
 
+_LONG = Signal(direction=1, weight=80)
+_SHORT = Signal(direction=-1, weight=80)
+
 
 class BbSqueezeStrategy:
     """Bollinger Band squeeze breakout.
@@ -29,12 +33,7 @@ class BbSqueezeStrategy:
         sym = master["symbol"]
         closes = master["close"]
 
-        bb_middle = closes.groupby(sym).transform(
-            lambda x: x.rolling(self.bb_period, min_periods=self.bb_period).mean()
-        )
-        bb_std = closes.groupby(sym).transform(
-            lambda x: x.rolling(self.bb_period, min_periods=self.bb_period).std(ddof=0)
-        )
+        bb_middle, bb_std = rolling_mean_std_by(closes, sym, self.bb_period)
         bb_upper = bb_middle + 2.0 * bb_std
         bb_lower = bb_middle - 2.0 * bb_std
         bandwidth = ((bb_upper - bb_lower) / bb_middle).fillna(0)
@@ -76,7 +75,7 @@ class BbSqueezeStrategy:
             return NO_SIGNAL
         # Breakout direction
         if self._close[i] > self._bb_middle[i]:
-            return Signal(direction=1, weight=80)
+            return _LONG
         elif self._close[i] < self._bb_middle[i]:
-            return Signal(direction=-1, weight=80)
+            return _SHORT
         return NO_SIGNAL
@@ -3,9 +3,12 @@ from __future__ import annotations
 import pandas as pd
 
 from crypto_trade.backtest_models import Signal
-from crypto_trade.indicators import rsi_series
+from crypto_trade.indicators import rolling_mean_std_by, rsi_series
 from crypto_trade.strategies import NO_SIGNAL
 
+_LONG = Signal(direction=1, weight=75)
+_SHORT = Signal(direction=-1, weight=75)
+
 
 class RsiBbStrategy:
     """RSI + Bollinger Bands mean reversion during volatile moments.
@@ -32,12 +35,7 @@ class RsiBbStrategy:
 
         rsi_vals = closes.groupby(sym).transform(lambda x: rsi_series(x, self.rsi_period))
 
-        bb_middle = closes.groupby(sym).transform(
-            lambda x: x.rolling(self.bb_period, min_periods=self.bb_period).mean()
-        )
-        bb_std = closes.groupby(sym).transform(
-            lambda x: x.rolling(self.bb_period, min_periods=self.bb_period).std(ddof=0)
-        )
+        bb_middle, bb_std = rolling_mean_std_by(closes, sym, self.bb_period)
         bb_upper = bb_middle + 2.0 * bb_std
         bb_lower = bb_middle - 2.0 * bb_std
 
@@ -62,7 +60,7 @@ class RsiBbStrategy:
 
         c = self._close[i]
         if rsi_val < self.rsi_oversold and c < self._bb_lower[i]:
-            return Signal(direction=1, weight=75)
+            return _LONG
         if rsi_val > self.rsi_overbought and c > bb_u:
-            return Signal(direction=-1, weight=75)
+            return _SHORT
         return NO_SIGNAL
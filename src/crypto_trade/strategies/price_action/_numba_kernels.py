@@ -0,0 +1,32 @@
+"""njit kernels shared by the price-action strategies."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from crypto_trade._njit import njit
+
+
+def streak_by(flags: np.ndarray, groups: pd.Series, n: int) -> np.ndarray:
+    """1 where the last *n* flags of the row's group are all set, else 0.
+
+    Equivalent to ``flags.groupby(groups).rolling(n, min_periods=n).min()``
+    followed by ``fillna(0)``, without a Python lambda per symbol.
+    """
+    flags = np.ascontiguousarray(flags, dtype=np.bool_)
+    out = np.zeros(len(flags), dtype=np.int8)
+    for idx in groups.groupby(groups, sort=False, observed=True).indices.values():
+        out[idx] = _streak_kernel(flags[idx], n)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _streak_kernel(flags: np.ndarray, n: int) -> np.ndarray:
+    out = np.zeros(len(flags), dtype=np.int8)
+    run = 0
+    for i in range(len(flags)):
+        run = run + 1 if flags[i] else 0
+        if run >= n:
+            out[i] = 1
+    return out
@@ -6,6 +6,10 @@ import pandas as pd
 
 from crypto_trade.backtest_models import Signal
 from crypto_trade.strategies import NO_SIGNAL
+from crypto_trade.strategies.price_action._numba_kernels import streak_by
+
+_LONG = Signal(direction=1, weight=60)
+_SHORT = Signal(direction=-1, weight=60)
 
 
 class ConsecutiveContinuationStrategy:
@@ -16,22 +20,11 @@ class ConsecutiveContinuationStrategy:
 
     def compute_features(self, master: pd.DataFrame) -> None:
         n = self.n_consecutive
-        is_bull = (master["close"] > master["open"]).astype(int)
-        is_bear = (master["close"] < master["open"]).astype(int)
-
-        bull_streak = (
-            is_bull.groupby(master["symbol"])
-            .transform(lambda x: x.rolling(n, min_periods=n).min())
-            .fillna(0)
-        )
-        bear_streak = (
-            is_bear.groupby(master["symbol"])
-            .transform(lambda x: x.rolling(n, min_periods=n).min())
-            .fillna(0)
-        )
-
-        self._bull = bull_streak.values
-        self._bear = bear_streak.values
+        o = master["open"].to_numpy()
+        c = master["close"].to_numpy()
+        sym = master["symbol"]
+        self._bull = streak_by(c > o, sym, n)
+        self._bear = streak_by(c < o, sym, n)
         self._sym = master["symbol"].values
         self._open_time = master["open_time"].values
         self._open = master["open"].values
@@ -50,9 +43,9 @@ class ConsecutiveContinuationStrategy:
         bull = self._bull[i]
         bear = self._bear[i]
         if bull == 1:
-            signal = Signal(direction=1, weight=60)
+            signal = _LONG
         elif bear == 1:
-            signal = Signal(direction=-1, weight=60)
+            signal = _SHORT
         else:
             signal = NO_SIGNAL
 
@@ -4,6 +4,10 @@ import pandas as pd
 
 from crypto_trade.backtest_models import Signal
 from crypto_trade.strategies import NO_SIGNAL
+from crypto_trade.strategies.price_action._numba_kernels import streak_by
+
+_LONG = Signal(direction=1, weight=60)
+_SHORT = Signal(direction=-1, weight=60)
 
 
 class ConsecutiveReversalStrategy:
@@ -14,22 +18,11 @@ class ConsecutiveReversalStrategy:
 
     def compute_features(self, master: pd.DataFrame) -> None:
         n = self.n_consecutive
-        is_bull = (master["close"] > master["open"]).astype(int)
-        is_bear = (master["close"] < master["open"]).astype(int)
-
-        bull_streak = (
-            is_bull.groupby(master["symbol"])
-            .transform(lambda x: x.rolling(n, min_periods=n).min())
-            .fillna(0)
-        )
-        bear_streak = (
-            is_bear.groupby(master["symbol"])
-            .transform(lambda x: x.rolling(n, min_periods=n).min())
-            .fillna(0)
-        )
-
-        self._bull = bull_streak.values
-        self._bear = bear_streak.values
+        o = master["open"].to_numpy()
+        c = master["close"].to_numpy()
+        sym = master["symbol"]
+        self._bull = streak_by(c > o, sym, n)
+        self._bear = streak_by(c < o, sym, n)
         self._pos = 0
 
     def skip(self) -> None:
@@ -39,7 +32,7 @@ class ConsecutiveReversalStrategy:
         i = self._pos
         self._pos += 1
         if self._bull[i] == 1:
-            return Signal(direction=-1, weight=60)  # reversal
+            return _SHORT  # reversal
         if self._bear[i] == 1:
-            return Signal(direction=1, weight=60)  # reversal
+            return _LONG  # reversal
         return NO_SIGNAL
@@ -5,6 +5,9 @@ import pandas as pd
 from crypto_trade.backtest_models import Signal
 from crypto_trade.strategies import NO_SIGNAL
 
+_LONG = Signal(direction=1, weight=50)
+_SHORT = Signal(direction=-1, weight=50)
+
 
 class FollowLeaderStrategy:
     """Trade in the same direction as the current candle (bullish -> buy, bearish -> sell)."""
@@ -23,7 +26,7 @@ class FollowLeaderStrategy:
         i = self._pos
         self._pos += 1
         if self._bull[i]:
-            return Signal(direction=1, weight=50)
+            return _LONG
         if self._bear[i]:
-            return Signal(direction=-1, weight=50)
+            return _SHORT
         return NO_SIGNAL
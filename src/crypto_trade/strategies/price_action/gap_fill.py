@@ -18,6 +18,8 @@ class GapFillStrategy:
 
         self._prev_close = prev_close.values
         self._open = master["open"].values
+        self._long = Signal(direction=1, weight=self.weight)
+        self._short = Signal(direction=-1, weight=self.weight)
         self._pos = 0
 
     def skip(self) -> None:
@@ -35,11 +37,11 @@ class GapFillStrategy:
         if curr_open > pc:
             gap = curr_open - pc
             if pc != 0 and gap / pc > 0.001:
-                return Signal(direction=-1, weight=self.weight)
+                return self._short
 
         if curr_open < pc:
             gap = pc - curr_open
             if pc != 0 and gap / pc > 0.001:
-                return Signal(direction=1, weight=self.weight)
+                return self._long
 
         return NO_SIGNAL
@@ -24,6 +24,8 @@ class InsideBarStrategy:
         self._high = master["high"].values
         self._low = master["low"].values
         self._close = master["close"].values
+        self._long = Signal(direction=1, weight=self.weight)
+        self._short = Signal(direction=-1, weight=self.weight)
         self._pos = 0
 
     def skip(self) -> None:
@@ -46,7 +48,7 @@ class InsideBarStrategy:
         mid = self._mid[i]
         curr_close = self._close[i]
         if curr_close > mid:
-            return Signal(direction=1, weight=self.weight)
+            return self._long
         elif curr_close < mid:
-            return Signal(direction=-1, weight=self.weight)
+            return self._short
         return NO_SIGNAL
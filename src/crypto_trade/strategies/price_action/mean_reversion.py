@@ -3,8 +3,12 @@ from __future__ import annotations
 import pandas as pd
 
 from crypto_trade.backtest_models import Signal
+from crypto_trade.indicators import rolling_mean_std_by
 from crypto_trade.strategies import NO_SIGNAL
 
+_LONG = Signal(direction=1, weight=60)
+_SHORT = Signal(direction=-1, weight=60)
+
 
 class MeanReversionStrategy:
     """Extreme candle reversal: current body > K * avg body -> bet on pullback."""
@@ -17,9 +21,7 @@ class MeanReversionStrategy:
         o = master["open"]
         c = master["close"]
         body = (c - o).abs()
-        avg_body = body.groupby(master["symbol"]).transform(
-            lambda x: x.rolling(self.lookback, min_periods=self.lookback).mean()
-        )
+        avg_body, _ = rolling_mean_std_by(body, master["symbol"], self.lookback)
         is_bullish = c > o
 
         self._body = body.values
@@ -41,7 +43,7 @@ class MeanReversionStrategy:
         if self._body[i] <= self.multiplier * avg:
             return NO_SIGNAL
         if self._is_bullish[i]:
-            return Signal(direction=-1, weight=60)
+            return _SHORT
         if self._body[i] > 0:  # bearish (body > 0 means c != o)
-            return Signal(direction=1, weight=60)
+            return _LONG
         return NO_SIGNAL
@@ -4,6 +4,10 @@ import pandas as pd
 
 from crypto_trade.backtest_models import Signal
 from crypto_trade.strategies import NO_SIGNAL
+from crypto_trade.strategies.price_action._numba_kernels import streak_by
+
+_LONG = Signal(direction=1, weight=70)
+_SHORT = Signal(direction=-1, weight=70)
 
 
 class MomentumStrategy:
@@ -17,29 +21,10 @@ class MomentumStrategy:
         n = self.n_candles
         o = master["open"]
         c = master["close"]
-        body_pct = ((c - o) / o).abs()
-        body_ok = body_pct >= self.min_body_pct
-        is_bull = (c > o).astype(int)
-        is_bear = (c < o).astype(int)
-
-        all_bull = (
-            (body_ok & is_bull.astype(bool))
-            .astype(int)
-            .groupby(master["symbol"])
-            .transform(lambda x: x.rolling(n, min_periods=n).min())
-            .fillna(0)
-        )
-
-        all_bear = (
-            (body_ok & is_bear.astype(bool))
-            .astype(int)
-            .groupby(master["symbol"])
-            .transform(lambda x: x.rolling(n, min_periods=n).min())
-            .fillna(0)
-        )
-
-        self._bull = all_bull.values
-        self._bear = all_bear.values
+        body_ok = (((c - o) / o).abs() >= self.min_body_pct).to_numpy()
+        sym = master["symbol"]
+        self._bull = streak_by(body_ok & (c > o).to_numpy(), sym, n)
+        self._bear = streak_by(body_ok & (c < o).to_numpy(), sym, n)
         self._pos = 0
 
     def skip(self) -> None:
@@ -49,7 +34,7 @@ class MomentumStrategy:
         i = self._pos
         self._pos += 1
         if self._bull[i] == 1:
-            return Signal(direction=1, weight=70)
+            return _LONG
         if self._bear[i] == 1:
-            return Signal(direction=-1, weight=70)
+            return _SHORT
         return NO_SIGNAL
@@ -6,6 +6,9 @@ import pandas as pd
 from crypto_trade.backtest_models import Signal
 from crypto_trade.strategies import NO_SIGNAL
 
+_LONG = Signal(direction=1, weight=65)
+_SHORT = Signal(direction=-1, weight=65)
+
 
 class WickRejectionStrategy:
     """Wick > K * body -> trade rejection direction."""
@@ -43,7 +46,7 @@ class WickRejectionStrategy:
         k = self.wick_body_ratio
 
         if lower > k * body and lower > upper:
-            return Signal(direction=1, weight=65)
+            return _LONG
         if upper > k * body and upper > lower:
-            return Signal(direction=-1, weight=65)
+            return _SHORT
         return NO_SIGNAL
@@ -0,0 +1,43 @@
+"""Master-DataFrame builder shared by the strategy and filter tests."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+# Column prototype: make_master fills every column not passed in with its
+# default (close_time defaults to open_time + 899999).
+MASTER_DEFAULTS: Mapping[str, tuple[float | int, type]] = MappingProxyType(
+    {
+        "open_time": (0, np.int64),
+        "open": (100.0, np.float64),
+        "high": (101.0, np.float64),
+        "low": (99.0, np.float64),
+        "close": (100.0, np.float64),
+        "volume": (1000.0, np.float64),
+        "close_time": (0, np.int64),
+        "quote_volume": (100000.0, np.float64),
+        "trades": (50, np.int64),
+        "taker_buy_volume": (500.0, np.float64),
+        "taker_buy_quote_volume": (50000.0, np.float64),
+    }
+)
+
+
+def make_master(symbol: str = "TEST", **kwargs) -> pd.DataFrame:
+    """Build a master DF from keyword lists."""
+    n = len(next(iter(kwargs.values()))) if kwargs else 1
+    cols = {
+        name: np.array(kwargs[name], dtype=dtype)
+        if name in kwargs
+        else np.full(n, default, dtype=dtype)
+        for name, (default, dtype) in MASTER_DEFAULTS.items()
+    }
+    if "close_time" not in kwargs:
+        cols["close_time"] = cols["open_time"] + 899999
+    df = pd.DataFrame(cols)
+    df["symbol"] = symbol
+    return df
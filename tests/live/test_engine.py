@@ -403,6 +403,25 @@ def test_engine_rebuild_risk_state_from_db(tmp_path):
     assert engine._peak_weighted_pnl["E"] >= engine._cum_weighted_pnl["E"]
 
 
+def test_engine_shutdown_closes_kline_clients(tmp_path):
+    """_shutdown releases the pooled connections of both kline clients."""
+    mc = ModelConfig(
+        name="A",
+        symbols=("BTCUSDT",),
+        use_atr_labeling=True,
+        atr_tp_multiplier=2.9,
+        atr_sl_multiplier=1.45,
+    )
+    engine = _make_engine_for_risk_tests(tmp_path, (mc,))
+    read_http = engine._read_client._client()
+    fetch_http = engine._fetch_client._client()
+
+    engine._shutdown()
+
+    assert read_http.is_closed and fetch_http.is_closed
+    assert engine._read_client._http is None and engine._fetch_client._http is None
+
+
 def test_cmd_live_default_is_dry_run_no_testnet(tmp_path):
     """Bare `live` (no flags) ⇒ dry_run, testnet=False, no auth URL."""
     from unittest.mock import patch
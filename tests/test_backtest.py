@@ -1,42 +1,51 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from crypto_trade.backtest import run_backtest
-from crypto_trade.backtest_models import BacktestConfig, Signal, TradeResult
+from crypto_trade.backtest import _exit_result, _scan_exit, check_order, run_backtest
+from crypto_trade.backtest_models import BacktestConfig, Order, Signal, TradeResult
 from crypto_trade.backtest_report import (
     aggregate_daily_pnl,
+    first_trade_per_symbol,
     generate_html_report,
     to_daily_returns_series,
 )
 from crypto_trade.models import Kline
-from crypto_trade.storage import write_klines
+from crypto_trade.storage import csv_path
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
 def _make_kline(
     open_time: int,
-    open: str,
-    high: str,
-    low: str,
-    close: str,
+    open: str | float,
+    high: str | float,
+    low: str | float,
+    close: str | float,
     close_time: int | None = None,
 ) -> Kline:
-    """Create a Kline with sensible defaults for non-essential fields."""
+    """Create a Kline with sensible defaults for non-essential fields.
+
+    Prices may be given as strings or numbers. Kline is frozen, so repeated
+    calls with the same arguments share one cached instance.
+    """
     if close_time is None:
         close_time = open_time + 3_600_000 - 1  # 1h candle
     return Kline(
         open_time=open_time,
-        open=open,
-        high=high,
-        low=low,
-        close=close,
+        open=str(open),
+        high=str(high),
+        low=str(low),
+        close=str(close),
         volume="100.0",
         close_time=close_time,
         quote_volume="10000.0",
@@ -52,29 +61,39 @@ BASE_T = 1_700_000_000_000  # arbitrary epoch-ms starting point
 
 
 def _write_symbol_data(data_dir: Path, symbol: str, klines: list[Kline]) -> None:
-    from crypto_trade.storage import csv_path
-
+    """Write a symbol's CSV in one call; fixture prices never need csv quoting."""
     path = csv_path(data_dir, symbol, "1h")
-    write_klines(path, klines)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [",".join(Kline.CSV_HEADER), *(",".join(k.to_row()) for k in klines)]
+    path.write_text("\n".join(lines) + "\n")
+
+
+# BacktestConfig is frozen, so one shared base is safe; tests only vary
+# the data dir and symbols.
+_BASE_CONFIG = BacktestConfig(
+    symbols=("TEST",),
+    interval="1h",
+    max_amount_usd=1000.0,
+    stop_loss_pct=2.0,
+    take_profit_pct=3.0,
+    timeout_minutes=180,  # 3 hours
+    fee_pct=0.1,
+)
 
 
 def _default_config(data_dir: Path, symbols: tuple[str, ...] = ("TEST",)) -> BacktestConfig:
-    return BacktestConfig(
-        symbols=symbols,
-        interval="1h",
-        max_amount_usd=1000.0,
-        stop_loss_pct=2.0,
-        take_profit_pct=3.0,
-        timeout_minutes=180,  # 3 hours
-        fee_pct=0.1,
-        data_dir=data_dir,
-    )
+    return replace(_BASE_CONFIG, symbols=symbols, data_dir=data_dir)
 
 
 # ---------------------------------------------------------------------------
 # Test strategies
 # ---------------------------------------------------------------------------
 
+# Signals are frozen, so strategies can hand out shared instances per candle.
+_BUY = Signal(direction=1, weight=100)
+_SELL = Signal(direction=-1, weight=100)
+_NONE = Signal(direction=0, weight=0)
+
 
 class AlwaysBuyStrategy:
     """Emit a buy signal on every kline (weight=100)."""
@@ -83,7 +102,7 @@ class AlwaysBuyStrategy:
         pass
 
     def get_signal(self, symbol: str, open_time: int) -> Signal:
-        return Signal(direction=1, weight=100)
+        return _BUY
 
 
 class AlwaysSellStrategy:
@@ -93,7 +112,7 @@ class AlwaysSellStrategy:
         pass
 
     def get_signal(self, symbol: str, open_time: int) -> Signal:
-        return Signal(direction=-1, weight=100)
+        return _SELL
 
 
 class DoNothingStrategy:
@@ -103,7 +122,20 @@ class DoNothingStrategy:
         pass
 
     def get_signal(self, symbol: str, open_time: int) -> Signal:
-        return Signal(direction=0, weight=0)
+        return _NONE
+
+
+class NeverTradesStrategy:
+    """Declares via can_trade() that it never trades."""
+
+    def can_trade(self) -> bool:
+        return False
+
+    def compute_features(self, master: pd.DataFrame) -> None:
+        raise AssertionError("run_backtest should short-circuit before compute_features")
+
+    def get_signal(self, symbol: str, open_time: int) -> Signal:
+        raise AssertionError("run_backtest should short-circuit before get_signal")
 
 
 class WeightedBuyStrategy:
@@ -128,8 +160,8 @@ class BuyOnceStrategy:
     def get_signal(self, symbol: str, open_time: int) -> Signal:
         if symbol not in self._bought:
             self._bought.add(symbol)
-            return Signal(direction=1, weight=100)
-        return Signal(direction=0, weight=0)
+            return _BUY
+        return _NONE
 
 
 # ---------------------------------------------------------------------------
@@ -453,6 +485,17 @@ class TestDailyPnL:
         assert d.avg_weighted_pnl == pytest.approx(expected_avg)
         assert len(d.trades) == 2
 
+    def test_unsorted_input_keeps_in_day_order(self) -> None:
+        day_start_ms = 1_699_920_000_000
+        a = _make_trade(day_start_ms + 7_200_000, 1.0)
+        b = _make_trade(day_start_ms + 86_400_000, 2.0)
+        c = _make_trade(day_start_ms + 3_600_000, 3.0)
+        daily = aggregate_daily_pnl([a, b, c])
+
+        assert [d.date for d in daily] == ["2023-11-14", "2023-11-15"]
+        assert daily[0].trades == (a, c)
+        assert daily[1].trades == (b,)
+
 
 class TestEmptyKlinesSkipped:
     """15. Empty/missing klines are skipped gracefully."""
@@ -515,14 +558,13 @@ class MinWeightBuyStrategy:
 
 class CustomWeightStrategy:
     def __init__(self, direction: int, weight: int) -> None:
-        self._direction = direction
-        self._weight = weight
+        self._signal = Signal(direction=direction, weight=weight)
 
     def compute_features(self, master: pd.DataFrame) -> None:
         pass
 
     def get_signal(self, symbol: str, open_time: int) -> Signal:
-        return Signal(direction=self._direction, weight=self._weight)
+        return self._signal
 
 
 class SellOnceStrategy:
@@ -535,8 +577,8 @@ class SellOnceStrategy:
     def get_signal(self, symbol: str, open_time: int) -> Signal:
         if symbol not in self._sold:
             self._sold.add(symbol)
-            return Signal(direction=-1, weight=100)
-        return Signal(direction=0, weight=0)
+            return _SELL
+        return _NONE
 
 
 class HistoryTrackingStrategy:
@@ -550,7 +592,7 @@ class HistoryTrackingStrategy:
 
     def get_signal(self, symbol: str, open_time: int) -> Signal:
         self.lengths.append(len(self.lengths) + 1)
-        return Signal(direction=0, weight=0)
+        return _NONE
 
 
 class CallOrderTracker:
@@ -564,7 +606,7 @@ class CallOrderTracker:
 
     def get_signal(self, symbol: str, open_time: int) -> Signal:
         self.calls.append((symbol, open_time))
-        return Signal(direction=0, weight=0)
+        return _NONE
 
 
 # ---------------------------------------------------------------------------
@@ -926,10 +968,7 @@ class TestMultiSymbolAdvanced:
         config = _default_config(tmp_path, symbols=("BTC", "ETH", "SOL"))
         results = run_backtest(config, AlwaysBuyStrategy())
 
-        first_by_sym: dict[str, TradeResult] = {}
-        for r in results:
-            if r.symbol not in first_by_sym:
-                first_by_sym[r.symbol] = r
+        first_by_sym = first_trade_per_symbol(results)
 
         assert first_by_sym["BTC"].exit_reason == "take_profit"
         assert first_by_sym["ETH"].exit_reason == "stop_loss"
@@ -1321,6 +1360,17 @@ class TestDoNothingMultiSymbol:
         results = run_backtest(config, DoNothingStrategy())
         assert len(results) == 0
 
+    def test_can_trade_false_short_circuits(self, tmp_path: Path) -> None:
+        klines = [
+            _make_kline(BASE_T, "100", "101", "99", "100"),
+            _make_kline(BASE_T + H, "100", "101", "99", "100"),
+        ]
+        _write_symbol_data(tmp_path, "SYM_A", klines)
+        _write_symbol_data(tmp_path, "SYM_B", klines)
+        config = _default_config(tmp_path, symbols=("SYM_A", "SYM_B"))
+        results = run_backtest(config, NeverTradesStrategy())
+        assert len(results) == 0
+
 
 # ---------------------------------------------------------------------------
 # 14. Results Sorting
@@ -1453,13 +1503,17 @@ class TestOrderCreationVerification:
 # ---------------------------------------------------------------------------
 
 
-class TestStartEndTime:
-    def _klines(self) -> list[Kline]:
-        return [_make_kline(BASE_T + i * H, "100", "101", "99", "100") for i in range(5)]
+@pytest.fixture(scope="class")
+def start_end_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Five flat 1h candles, written once and shared read-only by the class."""
+    data_dir = tmp_path_factory.mktemp("start_end")
+    klines = [_make_kline(BASE_T + i * H, "100", "101", "99", "100") for i in range(5)]
+    _write_symbol_data(data_dir, "TEST", klines)
+    return data_dir
 
-    def test_start_time_only(self, tmp_path: Path) -> None:
-        klines = self._klines()
-        _write_symbol_data(tmp_path, "TEST", klines)
+
+class TestStartEndTime:
+    def test_start_time_only(self, start_end_dir: Path) -> None:
         config = BacktestConfig(
             symbols=("TEST",),
             interval="1h",
@@ -1467,16 +1521,14 @@ class TestStartEndTime:
             stop_loss_pct=2.0,
             take_profit_pct=3.0,
             timeout_minutes=180,
-            data_dir=tmp_path,
+            data_dir=start_end_dir,
             start_time=BASE_T + 2 * H,
         )
         results = run_backtest(config, AlwaysBuyStrategy())
         for r in results:
             assert r.open_time >= BASE_T + 2 * H
 
-    def test_end_time_only(self, tmp_path: Path) -> None:
-        klines = self._klines()
-        _write_symbol_data(tmp_path, "TEST", klines)
+    def test_end_time_only(self, start_end_dir: Path) -> None:
         config = BacktestConfig(
             symbols=("TEST",),
             interval="1h",
@@ -1484,16 +1536,14 @@ class TestStartEndTime:
             stop_loss_pct=2.0,
             take_profit_pct=3.0,
             timeout_minutes=180,
-            data_dir=tmp_path,
+            data_dir=start_end_dir,
             end_time=BASE_T + 2 * H,
         )
         results = run_backtest(config, AlwaysBuyStrategy())
         for r in results:
             assert r.open_time <= BASE_T + 2 * H + H
 
-    def test_both_start_and_end_time(self, tmp_path: Path) -> None:
-        klines = self._klines()
-        _write_symbol_data(tmp_path, "TEST", klines)
+    def test_both_start_and_end_time(self, start_end_dir: Path) -> None:
         config = BacktestConfig(
             symbols=("TEST",),
             interval="1h",
@@ -1501,7 +1551,7 @@ class TestStartEndTime:
             stop_loss_pct=2.0,
             take_profit_pct=3.0,
             timeout_minutes=180,
-            data_dir=tmp_path,
+            data_dir=start_end_dir,
             start_time=BASE_T + 1 * H,
             end_time=BASE_T + 3 * H,
         )
@@ -1509,9 +1559,7 @@ class TestStartEndTime:
         run_backtest(config, strat)
         assert strat.lengths == [1, 2, 3]
 
-    def test_start_time_after_all_data(self, tmp_path: Path) -> None:
-        klines = self._klines()
-        _write_symbol_data(tmp_path, "TEST", klines)
+    def test_start_time_after_all_data(self, start_end_dir: Path) -> None:
         config = BacktestConfig(
             symbols=("TEST",),
             interval="1h",
@@ -1519,15 +1567,13 @@ class TestStartEndTime:
             stop_loss_pct=2.0,
             take_profit_pct=3.0,
             timeout_minutes=180,
-            data_dir=tmp_path,
+            data_dir=start_end_dir,
             start_time=BASE_T + 100 * H,
         )
         results = run_backtest(config, AlwaysBuyStrategy())
         assert results == []
 
-    def test_end_time_before_all_data(self, tmp_path: Path) -> None:
-        klines = self._klines()
-        _write_symbol_data(tmp_path, "TEST", klines)
+    def test_end_time_before_all_data(self, start_end_dir: Path) -> None:
         config = BacktestConfig(
             symbols=("TEST",),
             interval="1h",
@@ -1535,15 +1581,13 @@ class TestStartEndTime:
             stop_loss_pct=2.0,
             take_profit_pct=3.0,
             timeout_minutes=180,
-            data_dir=tmp_path,
+            data_dir=start_end_dir,
             end_time=BASE_T - H,
         )
         results = run_backtest(config, AlwaysBuyStrategy())
         assert results == []
 
-    def test_start_after_end_returns_empty(self, tmp_path: Path) -> None:
-        klines = self._klines()
-        _write_symbol_data(tmp_path, "TEST", klines)
+    def test_start_after_end_returns_empty(self, start_end_dir: Path) -> None:
         config = BacktestConfig(
             symbols=("TEST",),
             interval="1h",
@@ -1551,17 +1595,15 @@ class TestStartEndTime:
             stop_loss_pct=2.0,
             take_profit_pct=3.0,
             timeout_minutes=180,
-            data_dir=tmp_path,
+            data_dir=start_end_dir,
             start_time=BASE_T + 3 * H,
             end_time=BASE_T + 1 * H,
         )
         results = run_backtest(config, AlwaysBuyStrategy())
         assert results == []
 
-    def test_default_none_uses_full_range(self, tmp_path: Path) -> None:
-        klines = self._klines()
-        _write_symbol_data(tmp_path, "TEST", klines)
-        config = _default_config(tmp_path)
+    def test_default_none_uses_full_range(self, start_end_dir: Path) -> None:
+        config = _default_config(start_end_dir)
         strat = HistoryTrackingStrategy()
         run_backtest(config, strat)
         assert strat.lengths == [1, 2, 3, 4, 5]
@@ -1602,6 +1644,63 @@ class TestChronologicalIteration:
         assert symbols_seen == {"SYM_A", "SYM_B"}
 
 
+class TestScanExitMatchesCheckOrder:
+    """The compiled exit scan must agree with per-bar check_order."""
+
+    @pytest.mark.parametrize("direction", [1, -1])
+    def test_random_bars(self, direction: int) -> None:
+        rng = np.random.default_rng(7 + direction)
+        n = 400
+        opens = 100 + rng.normal(0, 1, n).cumsum()
+        highs = opens + rng.uniform(0, 2, n)
+        lows = opens - rng.uniform(0, 2, n)
+        open_times = BASE_T + np.arange(n, dtype=np.int64) * H
+        for start in range(0, n, 7):
+            entry = float(opens[start])
+            order = Order(
+                symbol="TEST",
+                direction=direction,
+                entry_price=entry,
+                amount_usd=1000.0,
+                weight_factor=1.0,
+                stop_loss_price=entry * (1 - 0.02 * direction),
+                take_profit_price=entry * (1 + 0.03 * direction),
+                open_time=int(open_times[start]),
+                timeout_time=int(open_times[start]) + 40 * H,
+            )
+            expected = None
+            for k in range(start + 1, n):
+                expected = check_order(
+                    order,
+                    int(open_times[k]),
+                    float(opens[k]),
+                    float(highs[k]),
+                    float(lows[k]),
+                    int(open_times[k]) + H - 1,
+                    0.1,
+                )
+                if expected is not None:
+                    break
+            k, code = _scan_exit(
+                direction,
+                order.stop_loss_price,
+                order.take_profit_price,
+                order.timeout_time,
+                open_times,
+                opens,
+                highs,
+                lows,
+                start + 1,
+            )
+            if expected is None:
+                assert k == -1
+                continue
+            actual = _exit_result(
+                order, code, int(open_times[k]), float(opens[k]), int(open_times[k]) + H - 1, 0.1
+            )
+            assert actual == expected
+
+
 # ---------------------------------------------------------------------------
 # Daily Returns Series & HTML Report
 # ---------------------------------------------------------------------------
@@ -1627,6 +1726,18 @@ def _make_trade(close_time: int, weighted_pnl: float) -> TradeResult:
     )
 
 
+class TestFirstTradePerSymbol:
+    def test_picks_earliest_close_per_symbol(self) -> None:
+        a_late = _make_trade(BASE_T + 2 * H, 1.0)
+        a_early = _make_trade(BASE_T + H, 2.0)
+        b = replace(a_late, symbol="OTHER", close_time=BASE_T + 3 * H)
+        first = first_trade_per_symbol([a_late, b, a_early])
+        assert first == {"TEST": a_early, "OTHER": b}
+
+    def test_empty(self) -> None:
+        assert first_trade_per_symbol([]) == {}
+
+
 class TestDailyReturnsSeries:
     # 2024-01-15 00:00 UTC in ms
     DAY1 = 1_705_276_800_000
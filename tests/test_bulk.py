@@ -1,18 +1,22 @@
 import csv
 import io
+import threading
 import zipfile
+from functools import lru_cache
 
 import httpx
+import pytest
 
 from crypto_trade.bulk import (
     MonthlyArchive,
+    TokenBucket,
     bulk_fetch_symbol,
     compute_missing_months,
     download_and_extract,
     list_monthly_archives,
 )
 from crypto_trade.models import Kline
-from crypto_trade.storage import csv_path, write_klines
+from crypto_trade.storage import csv_path, read_klines, write_klines
 
 S3_LISTING_XML = """\
 <?xml version="1.0" encoding="UTF-8"?>
@@ -34,6 +38,7 @@ S3_LISTING_XML = """\
 """
 
 
+@lru_cache(maxsize=256)
 def _make_kline(open_time: int) -> Kline:
     return Kline(
         open_time=open_time,
@@ -125,7 +130,7 @@ def test_download_and_extract_empty_zip():
     with httpx.Client(transport=transport) as http:
         klines = download_and_extract(http, "https://example.com/test.zip")
 
-    assert klines == []
+    assert len(klines) == 0
 
 
 def test_compute_missing_months_no_existing_data(tmp_path):
@@ -195,6 +200,48 @@ def test_bulk_fetch_symbol(tmp_path, monkeypatch):
     assert path.exists()
 
 
+def test_bulk_fetch_symbol_writes_in_month_order_when_downloads_finish_out_of_order(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr("crypto_trade.bulk.time.sleep", lambda _: None)
+
+    zip_jan = _make_zip([_make_csv_row(1000), _make_csv_row(2000)], "BTCUSDT-1m-2024-01.csv")
+    zip_feb = _make_zip([_make_csv_row(3000), _make_csv_row(4000)], "BTCUSDT-1m-2024-02.csv")
+
+    listing_xml = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <IsTruncated>false</IsTruncated>
+  <Contents>
+    <Key>data/futures/um/monthly/klines/BTCUSDT/1m/BTCUSDT-1m-2024-01.zip</Key>
+  </Contents>
+  <Contents>
+    <Key>data/futures/um/monthly/klines/BTCUSDT/1m/BTCUSDT-1m-2024-02.zip</Key>
+  </Contents>
+</ListBucketResult>
+"""
+    feb_done = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if "BTCUSDT-1m-2024-01.zip" in url:
+            # Hold January until February has been served.
+            assert feb_done.wait(timeout=5)
+            return httpx.Response(200, content=zip_jan)
+        elif "BTCUSDT-1m-2024-02.zip" in url:
+            feb_done.set()
+            return httpx.Response(200, content=zip_feb)
+        return httpx.Response(200, text=listing_xml)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport) as http:
+        count = bulk_fetch_symbol(http, "https://data.binance.vision", tmp_path, "BTCUSDT", "1m")
+
+    assert count == 4
+    times = [k.open_time for k in read_klines(csv_path(tmp_path, "BTCUSDT", "1m"))]
+    assert times == [1000, 2000, 3000, 4000]
+
+
 def test_bulk_fetch_symbol_skips_404(tmp_path, monkeypatch):
     monkeypatch.setattr("crypto_trade.bulk.time.sleep", lambda _: None)
     monkeypatch.setattr("crypto_trade.bulk.MAX_RETRIES", 1)
@@ -306,6 +353,36 @@ def test_bulk_fetch_symbol_handles_bad_csv(tmp_path, monkeypatch):
     assert count == 2
 
 
+def test_bulk_fetch_symbol_drops_invalid_rows_and_counts_them(tmp_path, monkeypatch):
+    """Inconsistent rows are dropped and reported; the rest of the month is kept."""
+    monkeypatch.setattr("crypto_trade.bulk.time.sleep", lambda _: None)
+
+    bad = _make_csv_row(2000)
+    bad[6] = bad[0]  # close_time must be after open_time
+    zip_data = _make_zip([_make_csv_row(1000), bad, _make_csv_row(3000)], "a.csv")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if ".zip" in str(request.url):
+            return httpx.Response(200, content=zip_data)
+        return httpx.Response(200, text=S3_LISTING_XML)
+
+    from crypto_trade.bulk import BulkProgress
+
+    progress = BulkProgress()
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport) as http:
+        count = bulk_fetch_symbol(
+            http, "https://data.binance.vision", tmp_path, "BTCUSDT", "1m", progress=progress
+        )
+
+    # Three archives in the listing serve the same rows, so the bad row is
+    # dropped three times and the good rows land once.
+    assert progress.errors == 3
+    assert count == 2
+    times = [k.open_time for k in read_klines(csv_path(tmp_path, "BTCUSDT", "1m"))]
+    assert times == [1000, 3000]
+
+
 def test_bulk_fetch_symbol_deduplicates(tmp_path, monkeypatch):
     """Doesn't write klines that already exist in the CSV."""
     monkeypatch.setattr("crypto_trade.bulk.time.sleep", lambda _: None)
@@ -341,3 +418,101 @@ def test_bulk_fetch_symbol_deduplicates(tmp_path, monkeypatch):
 
     # Only kline at 3000 should be written (1000, 2000 already exist)
     assert count == 1
+
+
+def test_bulk_fetch_symbol_drops_duplicate_rows_within_archive(tmp_path, monkeypatch):
+    monkeypatch.setattr("crypto_trade.bulk.time.sleep", lambda _: None)
+
+    rows = [_make_csv_row(1000), _make_csv_row(2000), _make_csv_row(2000), _make_csv_row(3000)]
+    zip_data = _make_zip(rows, "BTCUSDT-1m-2024-03.csv")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if ".zip" in str(request.url):
+            return httpx.Response(200, content=zip_data)
+        return httpx.Response(200, text=S3_LISTING_XML)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport) as http:
+        count = bulk_fetch_symbol(http, "https://data.binance.vision", tmp_path, "BTCUSDT", "1m")
+
+    # Three archives in the listing serve the same rows; each open_time lands once.
+    assert count == 3
+    times = [k.open_time for k in read_klines(csv_path(tmp_path, "BTCUSDT", "1m"))]
+    assert times == [1000, 2000, 3000]
+
+
+def test_bulk_fetch_symbol_merges_overlapping_archives_in_one_write(tmp_path, monkeypatch):
+    """Rows from later archives that fall between earlier rows are merged, not dropped."""
+    monkeypatch.setattr("crypto_trade.bulk.time.sleep", lambda _: None)
+
+    zips = {
+        "2024-01": _make_zip([_make_csv_row(1000), _make_csv_row(3000)], "a.csv"),
+        "2024-02": _make_zip([_make_csv_row(2000), _make_csv_row(4000)], "b.csv"),
+        "2024-03": _make_zip([_make_csv_row(3000), _make_csv_row(5000)], "c.csv"),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        for month, data in zips.items():
+            if url.endswith(f"{month}.zip"):
+                return httpx.Response(200, content=data)
+        return httpx.Response(200, text=S3_LISTING_XML)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport) as http:
+        count = bulk_fetch_symbol(http, "https://data.binance.vision", tmp_path, "BTCUSDT", "1m")
+
+    assert count == 5
+    times = [k.open_time for k in read_klines(csv_path(tmp_path, "BTCUSDT", "1m"))]
+    assert times == [1000, 2000, 3000, 4000, 5000]
+
+
+def test_bulk_fetch_symbol_keeps_buffered_months_on_transport_error(tmp_path, monkeypatch):
+    """Archives parsed before an uncaught error are still written to the CSV."""
+    monkeypatch.setattr("crypto_trade.bulk.time.sleep", lambda _: None)
+
+    zips = {
+        "2024-01": _make_zip([_make_csv_row(1000)], "a.csv"),
+        "2024-02": _make_zip([_make_csv_row(2000)], "b.csv"),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if url.endswith("2024-03.zip"):
+            raise httpx.ConnectError("connection reset", request=request)
+        for month, data in zips.items():
+            if url.endswith(f"{month}.zip"):
+                return httpx.Response(200, content=data)
+        return httpx.Response(200, text=S3_LISTING_XML)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport) as http, pytest.raises(httpx.ConnectError):
+        bulk_fetch_symbol(http, "https://data.binance.vision", tmp_path, "BTCUSDT", "1m")
+
+    times = [k.open_time for k in read_klines(csv_path(tmp_path, "BTCUSDT", "1m"))]
+    assert times == [1000, 2000]
+
+
+def test_token_bucket_sleeps_only_for_remaining_interval(monkeypatch):
+    clock = [100.0]
+    sleeps: list[float] = []
+    monkeypatch.setattr("crypto_trade.bulk.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("crypto_trade.bulk.time.sleep", sleeps.append)
+
+    bucket = TokenBucket(1.0)
+    bucket.acquire()  # first request goes straight out
+    clock[0] += 0.25
+    bucket.acquire()  # 0.75s of the interval still to wait
+    clock[0] += 5.0
+    bucket.acquire()  # interval long past: no wait
+
+    assert sleeps == [0.75]
+
+
+def test_token_bucket_disabled_with_zero_interval(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr("crypto_trade.bulk.time.sleep", sleeps.append)
+    bucket = TokenBucket(0.0)
+    for _ in range(3):
+        bucket.acquire()
+    assert sleeps == []
@@ -94,3 +94,15 @@ def test_params_include_start_and_end():
     assert captured_params[0]["startTime"] == "5000"
     assert captured_params[0]["endTime"] == "9000"
     assert captured_params[0]["limit"] == "1500"
+
+
+def test_http_client_is_reused_across_calls():
+    """One pooled connection serves every fetch until the client is closed."""
+    transport = _mock_transport([[_make_raw_kline(1000)], [_make_raw_kline(2000)]])
+    with BinanceClient(transport=transport) as client:
+        client.fetch_klines("BTCUSDT", "1h")
+        http = client._http
+        client.fetch_klines("ETHUSDT", "1h")
+        assert client._http is http
+    assert http.is_closed
+    assert client._http is None
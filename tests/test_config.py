@@ -6,6 +6,14 @@ import pytest
 from crypto_trade.config import Settings, load_settings
 
 
+@pytest.fixture(autouse=True)
+def _fresh_settings():
+    """Drop the cached Settings so each test sees its own environment."""
+    load_settings.cache_clear()
+    yield
+    load_settings.cache_clear()
+
+
 def test_load_settings_defaults():
     """Settings load with empty defaults when env vars are not set."""
     os.environ.pop("BINANCE_API_KEY", None)
@@ -95,3 +103,13 @@ def test_auth_base_url_unset_when_env_missing(monkeypatch):
     monkeypatch.delenv("BINANCE_AUTH_BASE_URL", raising=False)
     settings = load_settings()
     assert settings.auth_base_url is None
+
+
+def test_load_settings_is_cached(monkeypatch):
+    """Repeated calls return the same instance until the cache is cleared."""
+    monkeypatch.setenv("SYMBOLS", "BTCUSDT")
+    first = load_settings()
+    monkeypatch.setenv("SYMBOLS", "ETHUSDT")
+    assert load_settings() is first
+    load_settings.cache_clear()
+    assert load_settings().symbols == ("ETHUSDT",)
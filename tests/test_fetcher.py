@@ -1,3 +1,4 @@
+from functools import lru_cache
 from unittest.mock import MagicMock
 
 from crypto_trade.fetcher import fetch_all, fetch_symbol_interval
@@ -5,6 +6,7 @@ from crypto_trade.models import Kline
 from crypto_trade.storage import csv_path, write_klines
 
 
+@lru_cache(maxsize=256)
 def _make_kline(open_time: int) -> Kline:
     return Kline(
         open_time=open_time,
@@ -9,6 +9,8 @@ from crypto_trade.indicators import (
     atr,
     bollinger_bands,
     ema,
+    rolling_mean_std,
+    rolling_mean_std_by,
     rsi,
     rsi_series,
     sma,
@@ -16,6 +18,15 @@ from crypto_trade.indicators import (
     true_range,
 )
 
+# RSI inputs shared by TestRsi and TestRsiSeries; read-only so no test can
+# leak changes into another.
+_GAINS = np.arange(100, 116, dtype=np.float64)
+_LOSSES = np.arange(115, 99, -1, dtype=np.float64)
+_ZIGZAG = 100.0 + np.arange(16) % 2  # 100, 101, 100, ... : alternating +1/-1
+_FLAT_10 = np.full(10, 100.0)
+for _arr in (_GAINS, _LOSSES, _ZIGZAG, _FLAT_10):
+    _arr.flags.writeable = False
+
 
 class TestSma:
     def test_basic(self) -> None:
@@ -93,6 +104,42 @@ class TestBollingerBands:
         assert result.bandwidth == pytest.approx(0)
 
 
+class TestRollingMeanStd:
+    def test_matches_pandas_rolling(self) -> None:
+        rng = np.random.default_rng(3)
+        vals = 100 + rng.normal(0, 1, 500).cumsum()
+        mean, std = rolling_mean_std(vals, 20)
+        expected = pd.Series(vals).rolling(20, min_periods=20)
+        np.testing.assert_allclose(mean, expected.mean().to_numpy(), rtol=1e-12)
+        np.testing.assert_allclose(std, expected.std(ddof=0).to_numpy(), rtol=1e-9)
+
+    def test_nan_until_window_full(self) -> None:
+        mean, std = rolling_mean_std(np.arange(5, dtype=np.float64), 3)
+        assert np.isnan(mean[:2]).all() and np.isnan(std[:2]).all()
+        assert mean[2:].tolist() == pytest.approx([1.0, 2.0, 3.0])
+
+    def test_constant_values_zero_std(self) -> None:
+        _, std = rolling_mean_std(np.full(30, 42.5), 10)
+        assert (std[9:] == 0.0).all()
+
+    @pytest.mark.parametrize("bad", [np.nan, np.inf])
+    def test_non_finite_value_only_blanks_its_windows(self, bad: float) -> None:
+        vals = np.arange(40, dtype=np.float64)
+        vals[10] = bad
+        mean, std = rolling_mean_std(vals, 5)
+        expected = pd.Series(vals).rolling(5, min_periods=5)
+        np.testing.assert_allclose(mean, expected.mean().to_numpy(), rtol=1e-12)
+        np.testing.assert_allclose(std, expected.std(ddof=0).to_numpy(), rtol=1e-9)
+        assert np.isnan(mean[10:15]).all() and np.isfinite(mean[15:]).all()
+
+    def test_by_group_keeps_groups_separate(self) -> None:
+        values = pd.Series([1.0, 10.0, 2.0, 20.0, 3.0, 30.0])
+        groups = pd.Series(["A", "B", "A", "B", "A", "B"])
+        mean, _ = rolling_mean_std_by(values, groups, 2)
+        assert mean.isna().tolist() == [True, True, False, False, False, False]
+        assert mean.iloc[2:].tolist() == pytest.approx([1.5, 15.0, 2.5, 25.0])
+
+
 class TestTrueRange:
     def test_high_low_dominant(self) -> None:
         result = true_range(105.0, 100.0, 102.0)
@@ -119,40 +166,43 @@ class TestAtr:
     def test_insufficient_data(self) -> None:
         assert atr(np.array([10.0]), np.array([9.0]), np.array([10.0]), period=3) is None
 
+    @pytest.mark.parametrize("period", [0, -1])
+    def test_non_positive_period(self, period: int) -> None:
+        values = np.arange(10, dtype=np.float64)
+        assert atr(values + 1, values - 1, values, period=period) is None
+
     def test_needs_period_plus_one(self) -> None:
         highs = np.array([11, 12, 13], dtype=np.float64)
         lows = np.array([9, 10, 11], dtype=np.float64)
         closes = np.array([10, 11, 12], dtype=np.float64)
         assert atr(highs, lows, closes, period=3) is None
 
+    def test_only_last_window_counts(self) -> None:
+        # A huge early bar must not leak into the last-3-bar average.
+        highs = np.array([11, 500, 13, 14, 15, 16], dtype=np.float64)
+        lows = np.array([9, 1, 11, 12, 13, 14], dtype=np.float64)
+        closes = np.array([10, 250, 12, 13, 14, 15], dtype=np.float64)
+        assert atr(highs, lows, closes, period=3) == pytest.approx(2)
+
 
 class TestRsi:
     def test_all_gains(self) -> None:
-        closes = np.arange(100, 116, dtype=np.float64)
-        result = rsi(closes, period=14)
+        result = rsi(_GAINS, period=14)
         assert result is not None
         assert result == pytest.approx(100)
 
     def test_all_losses(self) -> None:
-        closes = np.arange(115, 99, -1, dtype=np.float64)
-        result = rsi(closes, period=14)
+        result = rsi(_LOSSES, period=14)
         assert result is not None
         assert result == pytest.approx(0)
 
     def test_mixed(self) -> None:
-        vals = [100.0]
-        for i in range(15):
-            if i % 2 == 0:
-                vals.append(vals[-1] + 1)
-            else:
-                vals.append(vals[-1] - 1)
-        closes = np.array(vals)
-        result = rsi(closes, period=14)
+        result = rsi(_ZIGZAG, period=14)
         assert result is not None
         assert 0 < result < 100
 
     def test_insufficient_data(self) -> None:
-        assert rsi(np.array([100.0] * 10), period=14) is None
+        assert rsi(_FLAT_10, period=14) is None
 
     def test_period_1(self) -> None:
         closes = np.array([100.0, 105.0])
@@ -163,29 +213,23 @@ class TestRsi:
 
 class TestRsiSeries:
     def test_all_gains(self) -> None:
-        closes = pd.Series(np.arange(100, 116, dtype=np.float64))
+        closes = pd.Series(_GAINS)
         result = rsi_series(closes, period=14)
         assert result.iloc[-1] == pytest.approx(100)
 
     def test_all_losses(self) -> None:
-        closes = pd.Series(np.arange(115, 99, -1, dtype=np.float64))
+        closes = pd.Series(_LOSSES)
         result = rsi_series(closes, period=14)
         assert result.iloc[-1] == pytest.approx(0)
 
     def test_mixed_in_range(self) -> None:
-        vals = [100.0]
-        for i in range(15):
-            if i % 2 == 0:
-                vals.append(vals[-1] + 1)
-            else:
-                vals.append(vals[-1] - 1)
-        closes = pd.Series(vals)
+        closes = pd.Series(_ZIGZAG)
         result = rsi_series(closes, period=14)
         last = result.iloc[-1]
         assert 0 < last < 100
 
     def test_insufficient_data_nan(self) -> None:
-        closes = pd.Series([100.0] * 10)
+        closes = pd.Series(_FLAT_10)
         result = rsi_series(closes, period=14)
         assert result.isna().all()
 
@@ -193,3 +237,12 @@ class TestRsiSeries:
         closes = pd.Series(np.arange(100, 130, dtype=np.float64))
         result = rsi_series(closes, period=14)
         assert len(result) == len(closes)
+
+    def test_matches_pandas_ewm(self) -> None:
+        rng = np.random.default_rng(7)
+        closes = pd.Series(100 + rng.normal(0, 1, 1000).cumsum())
+        delta = closes.diff()
+        gain = delta.where(delta > 0, 0.0).ewm(com=13, min_periods=14, adjust=False).mean()
+        loss = (-delta).where(delta < 0, 0.0).ewm(com=13, min_periods=14, adjust=False).mean()
+        expected = 100.0 - 100.0 / (1.0 + gain / loss)
+        pd.testing.assert_series_equal(rsi_series(closes, period=14), expected)
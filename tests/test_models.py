@@ -1,6 +1,10 @@
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
 import pytest
 
-from crypto_trade.models import Kline
+from crypto_trade.models import Kline, KlineBatch
 
 RAW_API_RESPONSE = [
     1704067200000,  # open_time
@@ -74,6 +78,23 @@ def test_csv_header_matches_field_count():
     assert len(Kline.CSV_HEADER) == len(kline.to_row())
 
 
+def test_equality_checks_every_field():
+    kline = Kline.from_api(RAW_API_RESPONSE)
+    same = Kline.from_api(list(RAW_API_RESPONSE))
+    assert kline == same and hash(kline) == hash(same)
+    for pos in range(11):
+        raw = list(RAW_API_RESPONSE)
+        raw[pos] = raw[pos] + 1 if isinstance(raw[pos], int) else raw[pos] + "1"
+        assert Kline.from_api(raw) != kline
+    assert kline != tuple(kline.to_row())
+
+
+def test_kline_uses_slots_and_header_is_not_a_field():
+    kline = Kline.from_api(RAW_API_RESPONSE)
+    assert not hasattr(kline, "__dict__")
+    assert tuple(f.name for f in fields(Kline)) == Kline.CSV_HEADER
+
+
 RAW_CSV_ROW = [
     "1704067200000",
     "42000.00",
@@ -118,3 +139,47 @@ def test_from_csv_row_round_trip():
     row = original.to_row()
     restored = Kline.from_csv_row(row)
     assert restored == original
+
+
+def test_kline_batch_from_frame_round_trips_rows():
+    df = pd.DataFrame([RAW_CSV_ROW, RAW_CSV_ROW], dtype=str)
+    batch = KlineBatch.from_frame(df)
+    assert len(batch) == 2
+    assert batch.open_time.dtype == np.int64
+    assert batch[0] == Kline.from_csv_row(RAW_CSV_ROW)
+    assert list(batch) == [Kline.from_csv_row(RAW_CSV_ROW)] * 2
+    first = batch[0]
+    assert all(isinstance(v, int) for v in (first.open_time, first.close_time, first.trades))
+
+
+def test_kline_batch_from_frame_rejects_non_numeric_time():
+    df = pd.DataFrame([["bad", *RAW_CSV_ROW[1:]]], dtype=str)
+    with pytest.raises(ValueError):
+        KlineBatch.from_frame(df)
+
+
+def test_kline_batch_take_and_concat():
+    kline = Kline.from_api(RAW_API_RESPONSE)
+    later = Kline.from_api([RAW_API_RESPONSE[0] + 3_600_000, *RAW_API_RESPONSE[1:]])
+    batch = KlineBatch.concat([KlineBatch.from_klines([later]), KlineBatch.from_klines([kline])])
+    ordered = batch.take(np.argsort(batch.open_time))
+    assert list(ordered) == [kline, later]
+    assert ordered[-1] == later
+
+
+def test_kline_batch_empty():
+    batch = KlineBatch.empty()
+    assert len(batch) == 0
+    assert list(batch) == []
+    with pytest.raises(IndexError):
+        batch[0]
+
+
+def test_kline_batch_drop_invalid_keeps_good_rows():
+    good = KlineBatch.from_frame(pd.DataFrame([RAW_CSV_ROW], dtype=str))
+    assert good.drop_invalid() is good
+
+    bad_row = [*RAW_CSV_ROW]
+    bad_row[6] = bad_row[0]  # close_time must be after open_time
+    batch = KlineBatch.from_frame(pd.DataFrame([bad_row, RAW_CSV_ROW], dtype=str))
+    assert list(batch.drop_invalid()) == list(good)
@@ -0,0 +1,44 @@
+from crypto_trade.s3_listing import parse_listing
+
+PAGE = b"""\
+<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>data.binance.vision</Name>
+  <Prefix>data/futures/um/monthly/klines/</Prefix>
+  <NextMarker>data/futures/um/monthly/klines/ETHUSDT/</NextMarker>
+  <IsTruncated>true</IsTruncated>
+  <Contents>
+    <Key>data/futures/um/monthly/klines/BTCUSDT/1m/BTCUSDT-1m-2024-01.zip</Key>
+    <Size>123</Size>
+  </Contents>
+  <CommonPrefixes>
+    <Prefix>data/futures/um/monthly/klines/BTCUSDT/</Prefix>
+  </CommonPrefixes>
+  <CommonPrefixes>
+    <Prefix>data/futures/um/monthly/klines/ETHUSDT/</Prefix>
+  </CommonPrefixes>
+</ListBucketResult>
+"""
+
+
+def test_parse_listing_reads_entries_and_pagination():
+    page = parse_listing(PAGE)
+    assert page.keys == ["data/futures/um/monthly/klines/BTCUSDT/1m/BTCUSDT-1m-2024-01.zip"]
+    # The request-level <Prefix> is not a common prefix.
+    assert page.prefixes == [
+        "data/futures/um/monthly/klines/BTCUSDT/",
+        "data/futures/um/monthly/klines/ETHUSDT/",
+    ]
+    assert page.is_truncated is True
+    assert page.next_marker == "data/futures/um/monthly/klines/ETHUSDT/"
+
+
+def test_parse_listing_empty_page():
+    page = parse_listing(
+        b'<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        b"<IsTruncated>false</IsTruncated></ListBucketResult>"
+    )
+    assert page.keys == []
+    assert page.prefixes == []
+    assert page.is_truncated is False
+    assert page.next_marker is None
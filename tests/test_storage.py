@@ -1,5 +1,16 @@
-from crypto_trade.models import Kline
-from crypto_trade.storage import csv_path, read_klines, read_last_open_time, write_klines
+import numpy as np
+import pandas as pd
+
+from crypto_trade.kline_array import load_kline_array
+from crypto_trade.models import Kline, KlineBatch
+from crypto_trade.storage import (
+    csv_path,
+    parquet_path,
+    read_kline_batch,
+    read_klines,
+    read_last_open_time,
+    write_klines,
+)
 
 
 def _make_kline(open_time: int = 1704067200000) -> Kline:
@@ -65,6 +76,26 @@ def test_append_mode(tmp_path):
     assert result[3].open_time == 4000
 
 
+def test_list_and_batch_writers_produce_identical_bytes(tmp_path):
+    klines = [_make_kline(1000), _make_kline(2000)]
+    from_list = tmp_path / "list.csv"
+    from_batch = tmp_path / "batch.csv"
+    write_klines(from_list, klines)
+    write_klines(from_batch, KlineBatch.from_klines(klines))
+    assert from_list.read_bytes() == from_batch.read_bytes()
+    assert from_list.read_bytes().endswith(b"25345678.45\r\n")
+
+
+def test_read_kline_batch_matches_read_klines(tmp_path):
+    path = csv_path(tmp_path, "BTCUSDT", "1h")
+    write_klines(path, [_make_kline(1000), _make_kline(2000)])
+    batch = read_kline_batch(path)
+    assert batch.open_time.tolist() == [1000, 2000]
+    assert batch.df["close"].tolist() == ["42300.25", "42300.25"]
+    assert list(batch) == read_klines(path)
+    assert len(read_kline_batch(tmp_path / "missing.csv")) == 0
+
+
 def test_read_klines_no_file(tmp_path):
     path = tmp_path / "missing.csv"
     assert read_klines(path) == []
@@ -76,3 +107,61 @@ def test_read_last_open_time_header_only(tmp_path):
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(",".join(Kline.CSV_HEADER) + "\n")
     assert read_last_open_time(path) is None
+
+
+def test_read_last_open_time_spans_multiple_tail_blocks(tmp_path, monkeypatch):
+    """A last line longer than the tail block makes the block double until it fits."""
+    monkeypatch.setattr("crypto_trade.storage._TAIL_BLOCK", 16)
+    path = csv_path(tmp_path, "BTCUSDT", "1h")
+    klines = [_make_kline(1000 * i) for i in range(1, 201)]
+    write_klines(path, klines)
+    assert len(path.read_bytes().splitlines()[-1]) > 4 * 16
+    assert read_last_open_time(path) == 200_000
+
+
+def test_read_last_open_time_ignores_trailing_blank_lines(tmp_path):
+    path = csv_path(tmp_path, "BTCUSDT", "1h")
+    write_klines(path, [_make_kline(1000), _make_kline(2000)])
+    with open(path, "a") as f:
+        f.write("\n\n")
+    assert read_last_open_time(path) == 2000
+
+
+def test_snapshot_stores_numeric_columns(tmp_path):
+    path = csv_path(tmp_path, "BTCUSDT", "1h")
+    write_klines(path, [_make_kline(1000), _make_kline(2000)])
+    load_kline_array(path, snapshot=True)
+    df = pd.read_parquet(parquet_path(path))
+    assert list(df.columns) == list(Kline.CSV_HEADER)
+    assert df["open_time"].dtype == np.int64
+    assert df["close"].dtype == np.float64
+    assert df["close"].tolist() == [42300.25, 42300.25]
+
+
+def test_snapshot_write_leaves_no_temp_files(tmp_path):
+    path = csv_path(tmp_path, "BTCUSDT", "1h")
+    write_klines(path, [_make_kline(1000), _make_kline(2000)])
+    load_kline_array(path, snapshot=True)
+    assert sorted(p.name for p in path.parent.iterdir()) == ["1h.csv", "1h.parquet"]
+
+
+def test_load_kline_array_uses_snapshot_until_csv_changes(tmp_path):
+    path = csv_path(tmp_path, "BTCUSDT", "1h")
+    write_klines(path, [_make_kline(1000), _make_kline(2000)])
+
+    first = load_kline_array(path, snapshot=True)
+    assert parquet_path(path).exists()
+    second = load_kline_array(path, snapshot=True)
+    assert second.open_time.tolist() == first.open_time.tolist() == [1000, 2000]
+
+    # An append changes the CSV's size, so the stale snapshot is rebuilt.
+    write_klines(path, [_make_kline(3000)], append=True)
+    assert load_kline_array(path, snapshot=True).open_time.tolist() == [1000, 2000, 3000]
+
+
+def test_load_kline_array_writes_no_snapshot_by_default(tmp_path):
+    path = csv_path(tmp_path, "BTCUSDT", "1h")
+    write_klines(path, [_make_kline(1000), _make_kline(2000)])
+
+    assert load_kline_array(path).open_time.tolist() == [1000, 2000]
+    assert not parquet_path(path).exists()
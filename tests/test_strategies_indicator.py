@@ -1,56 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import numpy as np
 import pandas as pd
+import pytest
 
 from crypto_trade.backtest_models import Signal
-from crypto_trade.kline_array import KlineArray
 from crypto_trade.strategies.indicator.bb_squeeze import BbSqueezeStrategy
 from crypto_trade.strategies.indicator.rsi_bb import RsiBbStrategy
-
-
-def _make_kline_array(**kwargs: list[float]) -> KlineArray:
-    """Build a KlineArray from keyword lists."""
-    n = 0
-    for v in kwargs.values():
-        n = len(v)
-        break
-    if n == 0:
-        n = 1
-
-    def _arr(key: str, default: float | int = 0, dtype=np.float64) -> np.ndarray:
-        if key in kwargs:
-            return np.array(kwargs[key], dtype=dtype)
-        return np.full(n, default, dtype=dtype)
-
-    open_time = _arr("open_time", 0, np.int64)
-    close_time = (
-        np.array(kwargs["close_time"], dtype=np.int64)
-        if "close_time" in kwargs
-        else open_time + 899999
-    )
-
-    return KlineArray.from_arrays(
-        open_time=open_time,
-        open=_arr("open", 100.0),
-        high=_arr("high", 101.0),
-        low=_arr("low", 99.0),
-        close=_arr("close", 100.0),
-        volume=_arr("volume", 1000.0),
-        close_time=close_time,
-        quote_volume=np.full(n, 100000.0),
-        trades=np.full(n, 50, dtype=np.int64),
-        taker_buy_volume=np.full(n, 500.0),
-        taker_buy_quote_volume=np.full(n, 50000.0),
-    )
-
-
-def _make_master(symbol: str = "TEST", **kwargs) -> pd.DataFrame:
-    """Build a master DF from keyword lists."""
-    ka = _make_kline_array(**kwargs)
-    df = ka.df.reset_index(drop=True)
-    df["symbol"] = symbol
-    return df
+from tests._masters import make_master
 
 
 def _get_last_signal(strategy, master: pd.DataFrame) -> Signal:
@@ -78,7 +38,7 @@ class TestRsiBbStrategy:
         highs = [101.0] * 15 + [100.0, 100.0, 96.0]
         lows = [99.0] * 15 + [98.0, 96.0, 70.0]
         open_times = [i * 900000 for i in range(18)]
-        master = _make_master(close=closes, open=opens, high=highs, low=lows, open_time=open_times)
+        master = make_master(close=closes, open=opens, high=highs, low=lows, open_time=open_times)
         result = _get_last_signal(s, master)
         assert result.direction == 1
 
@@ -89,14 +49,14 @@ class TestRsiBbStrategy:
         highs = [101.0] * 15 + [102.0, 104.0, 130.0]
         lows = [99.0] * 15 + [100.0, 100.0, 104.0]
         open_times = [i * 900000 for i in range(18)]
-        master = _make_master(close=closes, open=opens, high=highs, low=lows, open_time=open_times)
+        master = make_master(close=closes, open=opens, high=highs, low=lows, open_time=open_times)
         result = _get_last_signal(s, master)
         assert result.direction == -1
 
     def test_neutral_no_signal(self) -> None:
         s = RsiBbStrategy(rsi_period=14, bb_period=20)
         n = 25
-        master = _make_master(
+        master = make_master(
             close=[100.0] * n,
             open_time=[i * 900000 for i in range(n)],
         )
@@ -105,7 +65,7 @@ class TestRsiBbStrategy:
 
     def test_insufficient_history(self) -> None:
         s = RsiBbStrategy(rsi_period=14, bb_period=20)
-        master = _make_master(close=[100.0] * 10)
+        master = make_master(close=[100.0] * 10)
         result = _get_last_signal(s, master)
         assert result.direction == 0
 
@@ -115,33 +75,49 @@ class TestRsiBbStrategy:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def tight_history() -> Mapping[str, tuple[float, ...]]:
+    """Ten tight-range, low-volume bars: the squeeze before a breakout bar."""
+    return MappingProxyType(
+        {
+            "open": (100.0,) * 10,
+            "high": (100.01,) * 10,
+            "low": (99.99,) * 10,
+            "close": (100.0,) * 10,
+            "volume": (100.0,) * 10,
+            "open_time": tuple(i * 900000 for i in range(10)),
+        }
+    )
+
+
+def _with_breakout(history: Mapping[str, tuple[float, ...]], **bar: float) -> pd.DataFrame:
+    """Master DF of *history* followed by one bar (open_time follows on)."""
+    bar.setdefault("open_time", history["open_time"][-1] + 900000)
+    return make_master(**{col: values + (bar[col],) for col, values in history.items()})
+
+
 class TestBbSqueezeStrategy:
     def test_insufficient_history(self) -> None:
         s = BbSqueezeStrategy(bb_period=20, squeeze_lookback=10)
-        master = _make_master(close=[100.0] * 10)
+        master = make_master(close=[100.0] * 10)
         result = _get_last_signal(s, master)
         assert result.direction == 0
 
     def test_no_squeeze_no_signal(self) -> None:
         """No squeeze (volatile prices throughout) -> no signal."""
         s = BbSqueezeStrategy(bb_period=5, squeeze_lookback=3, squeeze_threshold=0.02)
-        n = 15
-        closes = [100.0 + (i % 2) * 10 for i in range(n)]
-        opens = closes[:]
-        highs = [c + 5 for c in closes]
-        lows = [c - 5 for c in closes]
-        master = _make_master(
-            open=opens,
-            high=highs,
-            low=lows,
+        closes = np.tile([100.0, 110.0], 8)[:15]  # alternating 100/110
+        master = make_master(
+            open=closes,
+            high=closes + 5,
+            low=closes - 5,
             close=closes,
-            volume=[1000.0] * n,
-            open_time=[i * 900000 for i in range(n)],
+            open_time=np.arange(15) * 900000,
         )
         result = _get_last_signal(s, master)
         assert result.direction == 0
 
-    def test_squeeze_then_expansion_bullish(self) -> None:
+    def test_squeeze_then_expansion_bullish(self, tight_history) -> None:
         """Tight BB then sudden expansion up with volume -> long."""
         s = BbSqueezeStrategy(
             bb_period=5,
@@ -149,24 +125,13 @@ class TestBbSqueezeStrategy:
             squeeze_threshold=0.05,
             vol_multiplier=1.5,
         )
-        n = 11
-        opens = [100.0] * 10 + [100.0]
-        highs = [100.01] * 10 + [115.0]
-        lows = [99.99] * 10 + [99.0]
-        closes = [100.0] * 10 + [112.0]
-        volumes = [100.0] * 10 + [5000.0]
-        master = _make_master(
-            open=opens,
-            high=highs,
-            low=lows,
-            close=closes,
-            volume=volumes,
-            open_time=[i * 900000 for i in range(n)],
+        master = _with_breakout(
+            tight_history, open=100.0, high=115.0, low=99.0, close=112.0, volume=5000.0
         )
         result = _get_last_signal(s, master)
         assert result.direction == 1
 
-    def test_squeeze_then_expansion_bearish(self) -> None:
+    def test_squeeze_then_expansion_bearish(self, tight_history) -> None:
         """Tight BB then sudden expansion down with volume -> short."""
         s = BbSqueezeStrategy(
             bb_period=5,
@@ -174,19 +139,8 @@ class TestBbSqueezeStrategy:
             squeeze_threshold=0.05,
             vol_multiplier=1.5,
         )
-        n = 11
-        opens = [100.0] * 10 + [100.0]
-        highs = [100.01] * 10 + [101.0]
-        lows = [99.99] * 10 + [85.0]
-        closes = [100.0] * 10 + [88.0]
-        volumes = [100.0] * 10 + [5000.0]
-        master = _make_master(
-            open=opens,
-            high=highs,
-            low=lows,
-            close=closes,
-            volume=volumes,
-            open_time=[i * 900000 for i in range(n)],
+        master = _with_breakout(
+            tight_history, open=100.0, high=101.0, low=85.0, close=88.0, volume=5000.0
         )
         result = _get_last_signal(s, master)
         assert result.direction == -1
@@ -0,0 +1,76 @@
+"""Opt-in timings for the price-action strategy hot paths.
+
+Deselected by default (see addopts in pyproject.toml). Run with:
+    uv run --with pytest-benchmark pytest -m perf tests/test_strategies_perf.py
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_trade.backtest_models import Signal
+from crypto_trade.strategies.price_action.consecutive_reversal import (
+    ConsecutiveReversalStrategy,
+)
+from crypto_trade.strategies.price_action.gap_fill import GapFillStrategy
+from crypto_trade.strategies.price_action.inside_bar import InsideBarStrategy
+from crypto_trade.strategies.price_action.mean_reversion import MeanReversionStrategy
+from crypto_trade.strategies.price_action.momentum import MomentumStrategy
+from crypto_trade.strategies.price_action.wick_rejection import WickRejectionStrategy
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+_STRATEGIES = [
+    pytest.param(MomentumStrategy(n_candles=3, min_body_pct=0.1), id="momentum"),
+    pytest.param(MeanReversionStrategy(lookback=20, multiplier=2.5), id="mean_reversion"),
+    pytest.param(ConsecutiveReversalStrategy(n_consecutive=4), id="consecutive_reversal"),
+    pytest.param(WickRejectionStrategy(wick_body_ratio=2.0), id="wick_rejection"),
+    pytest.param(InsideBarStrategy(), id="inside_bar"),
+    pytest.param(GapFillStrategy(), id="gap_fill"),
+]
+
+
+@pytest.fixture(scope="module")
+def master() -> pd.DataFrame:
+    """10 symbols x 20k 15m bars (about seven months each)."""
+    n, n_symbols = 200_000, 10
+    rng = np.random.default_rng(0)
+    close = 100.0 + np.abs(rng.normal(0, 0.5, n).cumsum())
+    open_ = close + rng.normal(0, 0.3, n)
+    return pd.DataFrame(
+        {
+            "open_time": np.tile(np.arange(n // n_symbols, dtype=np.int64) * 900000, n_symbols),
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.random(n),
+            "low": np.minimum(open_, close) - rng.random(n),
+            "close": close,
+            "symbol": np.repeat([f"S{i}" for i in range(n_symbols)], n // n_symbols),
+        }
+    )
+
+
+@pytest.mark.parametrize("strategy", _STRATEGIES)
+def test_compute_features(benchmark, strategy, master: pd.DataFrame) -> None:
+    benchmark.group = "compute_features"
+    benchmark(strategy.compute_features, master)
+
+
+@pytest.mark.parametrize("strategy", _STRATEGIES)
+def test_signal_walk(benchmark, strategy, master: pd.DataFrame) -> None:
+    """Per-bar get_signal loop, as run_backtest drives it."""
+    benchmark.group = "get_signal"
+    syms = master["symbol"].tolist()
+    ots = master["open_time"].tolist()
+
+    def walk() -> Signal:
+        strategy.compute_features(master)
+        signal = None
+        for sym, ot in zip(syms, ots, strict=True):
+            signal = strategy.get_signal(sym, ot)
+        return signal
+
+    benchmark.pedantic(walk, rounds=3, iterations=1)
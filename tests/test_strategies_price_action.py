@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import NamedTuple
+
 import numpy as np
 import pandas as pd
+import pytest
 
-from crypto_trade.backtest_models import Signal
-from crypto_trade.kline_array import KlineArray
+from crypto_trade.backtest_models import Signal, Strategy
+from crypto_trade.strategies.price_action._numba_kernels import streak_by
 from crypto_trade.strategies.price_action.consecutive_reversal import (
     ConsecutiveReversalStrategy,
 )
@@ -14,54 +19,21 @@ from crypto_trade.strategies.price_action.inside_bar import InsideBarStrategy
 from crypto_trade.strategies.price_action.mean_reversion import MeanReversionStrategy
 from crypto_trade.strategies.price_action.momentum import MomentumStrategy
 from crypto_trade.strategies.price_action.wick_rejection import WickRejectionStrategy
+from tests._masters import make_master
 
 
-def _make_kline_array(**kwargs: list[float]) -> KlineArray:
-    """Build a KlineArray from keyword lists.
-
-    Accepted keys: open_time, open, high, low, close, volume, close_time.
-    Missing fields get sensible defaults.
-    """
-    n = 0
-    for v in kwargs.values():
-        n = len(v)
-        break
-    if n == 0:
-        n = 1
-
-    def _arr(key: str, default: float | int = 0, dtype=np.float64) -> np.ndarray:
-        if key in kwargs:
-            return np.array(kwargs[key], dtype=dtype)
-        return np.full(n, default, dtype=dtype)
-
-    open_time = _arr("open_time", 0, np.int64)
-    close_time = (
-        np.array(kwargs["close_time"], dtype=np.int64)
-        if "close_time" in kwargs
-        else open_time + 899999
-    )
+def _then(history: Mapping[str, tuple[float, ...]], **bar: float) -> dict[str, tuple[float, ...]]:
+    """Columns of *history* followed by one more bar."""
+    return {col: values + (bar[col],) for col, values in history.items()}
 
-    return KlineArray.from_arrays(
-        open_time=open_time,
-        open=_arr("open", 100.0),
-        high=_arr("high", 101.0),
-        low=_arr("low", 99.0),
-        close=_arr("close", 100.0),
-        volume=_arr("volume", 1000.0),
-        close_time=close_time,
-        quote_volume=np.full(n, 100000.0),
-        trades=np.full(n, 50, dtype=np.int64),
-        taker_buy_volume=np.full(n, 500.0),
-        taker_buy_quote_volume=np.full(n, 50000.0),
-    )
 
-
-def _make_master(symbol: str = "TEST", **kwargs) -> pd.DataFrame:
-    """Build a master DF from keyword lists."""
-    ka = _make_kline_array(**kwargs)
-    df = ka.df.reset_index(drop=True)
-    df["symbol"] = symbol
-    return df
+# Runs of four ordinary candles (body 1, range 2) for big-candle scenarios.
+_SMALL_BULL_4: Mapping[str, tuple[float, ...]] = MappingProxyType(
+    {"open": (100.0,) * 4, "high": (101.0,) * 4, "low": (99.0,) * 4, "close": (101.0,) * 4}
+)
+_SMALL_BEAR_4: Mapping[str, tuple[float, ...]] = MappingProxyType(
+    {"open": (100.0,) * 4, "high": (101.0,) * 4, "low": (99.0,) * 4, "close": (99.0,) * 4}
+)
 
 
 def _get_last_signal(strategy, master: pd.DataFrame) -> Signal:
@@ -75,307 +47,312 @@ def _get_last_signal(strategy, master: pd.DataFrame) -> Signal:
     return signal
 
 
-# ---------------------------------------------------------------------------
-# MomentumStrategy
-# ---------------------------------------------------------------------------
-
-
-class TestMomentumStrategy:
-    def test_bullish_momentum(self) -> None:
-        s = MomentumStrategy(n_candles=3, min_body_pct=0.1)
-        master = _make_master(
-            open=[100.0, 102.0, 104.0],
-            high=[103.0, 105.0, 107.0],
-            low=[99.0, 101.0, 103.0],
-            close=[102.0, 104.0, 106.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 1
-
-    def test_bearish_momentum(self) -> None:
-        s = MomentumStrategy(n_candles=3, min_body_pct=0.1)
-        master = _make_master(
-            open=[106.0, 104.0, 102.0],
-            high=[107.0, 105.0, 103.0],
-            low=[103.0, 101.0, 99.0],
-            close=[104.0, 102.0, 100.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == -1
-
-    def test_mixed_direction_no_signal(self) -> None:
-        s = MomentumStrategy(n_candles=3, min_body_pct=0.1)
-        master = _make_master(
-            open=[100.0, 102.0, 100.0],
-            high=[103.0, 103.0, 103.0],
-            low=[99.0, 99.0, 99.0],
-            close=[102.0, 100.0, 102.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_small_body_no_signal(self) -> None:
-        s = MomentumStrategy(n_candles=3, min_body_pct=0.1)
-        master = _make_master(
-            open=[100.0, 100.05, 100.1],
-            high=[101.0, 101.0, 101.0],
-            low=[99.0, 99.0, 99.0],
-            close=[100.05, 100.1, 100.15],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_insufficient_history(self) -> None:
-        s = MomentumStrategy(n_candles=3)
-        master = _make_master(open=[100.0], close=[102.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-
-# ---------------------------------------------------------------------------
-# MeanReversionStrategy
-# ---------------------------------------------------------------------------
-
-
-class TestMeanReversionStrategy:
-    def test_big_bullish_candle_triggers_short(self) -> None:
-        s = MeanReversionStrategy(lookback=5, multiplier=2.0)
-        master = _make_master(
-            open=[100.0, 100.0, 100.0, 100.0, 100.0],
-            high=[101.0, 101.0, 101.0, 101.0, 115.0],
-            low=[99.0, 99.0, 99.0, 99.0, 99.0],
-            close=[101.0, 101.0, 101.0, 101.0, 110.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == -1
-
-    def test_big_bearish_candle_triggers_long(self) -> None:
-        s = MeanReversionStrategy(lookback=5, multiplier=2.0)
-        master = _make_master(
-            open=[100.0, 100.0, 100.0, 100.0, 110.0],
-            high=[101.0, 101.0, 101.0, 101.0, 111.0],
-            low=[99.0, 99.0, 99.0, 99.0, 95.0],
-            close=[99.0, 99.0, 99.0, 99.0, 100.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 1
-
-    def test_normal_candle_no_signal(self) -> None:
-        s = MeanReversionStrategy(lookback=5, multiplier=2.0)
-        master = _make_master(
-            open=[100.0] * 5,
-            close=[101.0] * 5,
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_insufficient_history(self) -> None:
-        s = MeanReversionStrategy(lookback=20)
-        master = _make_master(open=[100.0] * 5, close=[100.0] * 5)
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-
-# ---------------------------------------------------------------------------
-# WickRejectionStrategy
-# ---------------------------------------------------------------------------
-
-
-class TestWickRejectionStrategy:
-    def test_lower_wick_rejection_bullish(self) -> None:
-        s = WickRejectionStrategy(wick_body_ratio=2.0)
-        master = _make_master(open=[100.0], high=[101.0], low=[94.0], close=[101.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == 1
-
-    def test_upper_wick_rejection_bearish(self) -> None:
-        s = WickRejectionStrategy(wick_body_ratio=2.0)
-        master = _make_master(open=[101.0], high=[108.0], low=[100.0], close=[100.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == -1
-
-    def test_no_wick_no_signal(self) -> None:
-        s = WickRejectionStrategy(wick_body_ratio=2.0)
-        master = _make_master(open=[100.0], high=[105.0], low=[100.0], close=[105.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_doji_no_signal(self) -> None:
-        s = WickRejectionStrategy()
-        master = _make_master(open=[100.0], high=[101.0], low=[99.0], close=[100.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-
-# ---------------------------------------------------------------------------
-# InsideBarStrategy
-# ---------------------------------------------------------------------------
-
-
-class TestInsideBarStrategy:
-    def test_inside_bar_bullish(self) -> None:
-        s = InsideBarStrategy()
-        master = _make_master(
-            open=[95.0, 98.0],
-            high=[110.0, 105.0],
-            low=[90.0, 95.0],
-            close=[105.0, 103.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 1
-
-    def test_inside_bar_bearish(self) -> None:
-        s = InsideBarStrategy()
-        master = _make_master(
-            open=[95.0, 102.0],
-            high=[110.0, 105.0],
-            low=[90.0, 95.0],
-            close=[105.0, 97.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == -1
-
-    def test_not_inside_bar_no_signal(self) -> None:
-        s = InsideBarStrategy()
-        master = _make_master(
-            open=[100.0, 103.0],
-            high=[105.0, 108.0],
-            low=[95.0, 96.0],
-            close=[102.0, 106.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_insufficient_history(self) -> None:
-        s = InsideBarStrategy()
-        master = _make_master(open=[100.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-
-# ---------------------------------------------------------------------------
-# GapFillStrategy
-# ---------------------------------------------------------------------------
+@pytest.fixture(scope="module")
+def bullish_bar() -> pd.DataFrame:
+    """A single bullish bar: a signal for FollowLeader, warmup for the rest."""
+    return make_master(open=[100.0], close=[102.0])
 
 
-class TestGapFillStrategy:
-    def test_gap_up_triggers_short(self) -> None:
-        s = GapFillStrategy()
-        master = _make_master(
-            open=[100.0, 102.0],
-            close=[100.0, 101.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == -1
-
-    def test_gap_down_triggers_long(self) -> None:
-        s = GapFillStrategy()
-        master = _make_master(
-            open=[100.0, 98.0],
-            close=[100.0, 99.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 1
-
-    def test_no_gap_no_signal(self) -> None:
-        s = GapFillStrategy()
-        master = _make_master(
-            open=[100.0, 100.0],
-            close=[100.0, 101.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_tiny_gap_ignored(self) -> None:
-        s = GapFillStrategy()
-        master = _make_master(
-            open=[100.0, 100.05],
-            close=[100.0, 100.1],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_insufficient_history(self) -> None:
-        s = GapFillStrategy()
-        master = _make_master(open=[100.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
+@pytest.mark.parametrize(
+    "strategy",
+    [MomentumStrategy(n_candles=3), InsideBarStrategy(), GapFillStrategy()],
+    ids=lambda s: type(s).__name__,
+)
+def test_single_bar_is_warmup(strategy, bullish_bar: pd.DataFrame) -> None:
+    assert _get_last_signal(strategy, bullish_bar).direction == 0
+
+
+@pytest.mark.parametrize("n", [1, 3, 6])
+def test_streak_by_matches_pandas_rolling_min(n: int) -> None:
+    rng = np.random.default_rng(n)
+    flags = pd.Series(rng.random(3000) < 0.7)
+    groups = pd.Series(rng.choice(["A", "B", "C"], size=3000))
+    expected = (
+        flags.astype(int)
+        .groupby(groups)
+        .transform(lambda x: x.rolling(n, min_periods=n).min())
+        .fillna(0)
+    )
+    assert streak_by(flags.to_numpy(), groups, n).tolist() == expected.astype(int).tolist()
 
 
 # ---------------------------------------------------------------------------
-# ConsecutiveReversalStrategy
+# Whole-history NumPy oracles
 # ---------------------------------------------------------------------------
 
 
-class TestConsecutiveReversalStrategy:
-    def test_bullish_streak_triggers_short_reversal(self) -> None:
-        s = ConsecutiveReversalStrategy(n_consecutive=4)
-        master = _make_master(
-            open=[100.0, 102.0, 104.0, 106.0],
-            close=[102.0, 104.0, 106.0, 108.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == -1
-
-    def test_bearish_streak_triggers_long_reversal(self) -> None:
-        s = ConsecutiveReversalStrategy(n_consecutive=4)
-        master = _make_master(
-            open=[108.0, 106.0, 104.0, 102.0],
-            close=[106.0, 104.0, 102.0, 100.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 1
-
-    def test_mixed_no_signal(self) -> None:
-        s = ConsecutiveReversalStrategy(n_consecutive=4)
-        master = _make_master(
-            open=[100.0, 102.0, 100.0, 102.0],
-            close=[102.0, 100.0, 102.0, 104.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_insufficient_history(self) -> None:
-        s = ConsecutiveReversalStrategy(n_consecutive=4)
-        master = _make_master(
-            open=[100.0, 100.0, 100.0],
-            close=[102.0, 102.0, 102.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
-
-    def test_custom_n(self) -> None:
-        s = ConsecutiveReversalStrategy(n_consecutive=2)
-        master = _make_master(
-            open=[100.0, 102.0],
-            close=[102.0, 104.0],
-        )
-        result = _get_last_signal(s, master)
-        assert result.direction == -1
+def _directions(strategy, master: pd.DataFrame) -> np.ndarray:
+    """Signal direction at every bar of *master*."""
+    strategy.compute_features(master)
+    ots = master["open_time"].values
+    return np.array([strategy.get_signal("TEST", int(t)).direction for t in ots])
+
+
+def _all_last(flags: np.ndarray, n: int) -> np.ndarray:
+    """True where the trailing *n* flags are all set (False during warmup)."""
+    out = np.zeros(len(flags), dtype=bool)
+    out[n - 1 :] = np.lib.stride_tricks.sliding_window_view(flags, n).all(axis=1)
+    return out
+
+
+def _momentum_oracle(o: np.ndarray, c: np.ndarray, n: int, min_body_pct: float) -> np.ndarray:
+    ok = np.abs(c - o) / o >= min_body_pct / 100.0
+    bull, bear = _all_last(ok & (c > o), n), _all_last(ok & (c < o), n)
+    return np.where(bull, 1, np.where(bear, -1, 0))
+
+
+def _reversal_oracle(o: np.ndarray, c: np.ndarray, n: int) -> np.ndarray:
+    return np.where(_all_last(c > o, n), -1, np.where(_all_last(c < o, n), 1, 0))
+
+
+def _mean_reversion_oracle(
+    o: np.ndarray, c: np.ndarray, lookback: int, multiplier: float
+) -> np.ndarray:
+    body = np.abs(c - o)
+    avg = np.full(len(body), np.nan)
+    avg[lookback - 1 :] = np.lib.stride_tricks.sliding_window_view(body, lookback).mean(axis=1)
+    extreme = body > multiplier * avg  # NaN warmup compares False
+    return np.where(extreme & (c > o), -1, np.where(extreme & (c < o), 1, 0))
+
+
+@pytest.fixture(scope="module")
+def random_walk() -> pd.DataFrame:
+    """500 bars with small, random bodies, so streaks and extremes both occur."""
+    rng = np.random.default_rng(42)
+    close = 100.0 + rng.normal(0, 0.5, 500).cumsum()
+    open_ = close - rng.normal(0, 0.3, 500) * rng.choice([0.2, 1.0, 4.0], 500)
+    return make_master(open=open_, close=close, open_time=np.arange(500) * 900000)
+
+
+@pytest.mark.parametrize(
+    ("strategy", "oracle"),
+    [
+        pytest.param(
+            MomentumStrategy(n_candles=3, min_body_pct=0.1),
+            lambda o, c: _momentum_oracle(o, c, 3, 0.1),
+            id="momentum",
+        ),
+        pytest.param(
+            ConsecutiveReversalStrategy(n_consecutive=4),
+            lambda o, c: _reversal_oracle(o, c, 4),
+            id="consecutive_reversal",
+        ),
+        pytest.param(
+            MeanReversionStrategy(lookback=20, multiplier=2.0),
+            lambda o, c: _mean_reversion_oracle(o, c, 20, 2.0),
+            id="mean_reversion",
+        ),
+    ],
+)
+def test_matches_numpy_oracle(strategy, oracle, random_walk: pd.DataFrame) -> None:
+    o = random_walk["open"].to_numpy()
+    c = random_walk["close"].to_numpy()
+    expected = oracle(o, c)
+    assert (expected != 0).any()  # the walk must actually exercise the signal
+    assert _directions(strategy, random_walk).tolist() == expected.tolist()
 
 
 # ---------------------------------------------------------------------------
-# FollowLeaderStrategy
+# Scenarios: one strategy, one short history, the expected last direction
 # ---------------------------------------------------------------------------
 
 
-class TestFollowLeaderStrategy:
-    def test_bullish_candle(self) -> None:
-        s = FollowLeaderStrategy()
-        master = _make_master(open=[100.0], close=[105.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == 1
-        assert result.weight == 50
-
-    def test_bearish_candle(self) -> None:
-        s = FollowLeaderStrategy()
-        master = _make_master(open=[105.0], close=[100.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == -1
-        assert result.weight == 50
-
-    def test_doji_no_signal(self) -> None:
-        s = FollowLeaderStrategy()
-        master = _make_master(open=[100.0], close=[100.0])
-        result = _get_last_signal(s, master)
-        assert result.direction == 0
+class Scenario(NamedTuple):
+    name: str
+    strategy: Strategy
+    columns: Mapping[str, Sequence[float]]
+    expected: int
+
+
+# One instance per configuration, shared by every scenario that uses it;
+# compute_features rebuilds all per-run state, so reuse is safe.
+_MOMENTUM = MomentumStrategy(n_candles=3, min_body_pct=0.1)
+_MEAN_REVERSION = MeanReversionStrategy(lookback=5, multiplier=2.0)
+_WICK_REJECTION = WickRejectionStrategy(wick_body_ratio=2.0)
+_INSIDE_BAR = InsideBarStrategy()
+_GAP_FILL = GapFillStrategy()
+_REVERSAL = ConsecutiveReversalStrategy(n_consecutive=4)
+_FOLLOW_LEADER = FollowLeaderStrategy()
+
+SCENARIOS = [
+    # MomentumStrategy
+    Scenario(
+        "momentum_bullish",
+        _MOMENTUM,
+        {
+            "open": [100.0, 102.0, 104.0],
+            "high": [103.0, 105.0, 107.0],
+            "low": [99.0, 101.0, 103.0],
+            "close": [102.0, 104.0, 106.0],
+        },
+        1,
+    ),
+    Scenario(
+        "momentum_bearish",
+        _MOMENTUM,
+        {
+            "open": [106.0, 104.0, 102.0],
+            "high": [107.0, 105.0, 103.0],
+            "low": [103.0, 101.0, 99.0],
+            "close": [104.0, 102.0, 100.0],
+        },
+        -1,
+    ),
+    Scenario(
+        "momentum_mixed_direction_no_signal",
+        _MOMENTUM,
+        {
+            "open": [100.0, 102.0, 100.0],
+            "high": [103.0, 103.0, 103.0],
+            "low": [99.0, 99.0, 99.0],
+            "close": [102.0, 100.0, 102.0],
+        },
+        0,
+    ),
+    Scenario(
+        "momentum_small_body_no_signal",
+        _MOMENTUM,
+        {
+            "open": [100.0, 100.05, 100.1],
+            "high": [101.0, 101.0, 101.0],
+            "low": [99.0, 99.0, 99.0],
+            "close": [100.05, 100.1, 100.15],
+        },
+        0,
+    ),
+    # MeanReversionStrategy
+    Scenario(
+        "mean_reversion_big_bullish_candle_triggers_short",
+        _MEAN_REVERSION,
+        _then(_SMALL_BULL_4, open=100.0, high=115.0, low=99.0, close=110.0),
+        -1,
+    ),
+    Scenario(
+        "mean_reversion_big_bearish_candle_triggers_long",
+        _MEAN_REVERSION,
+        _then(_SMALL_BEAR_4, open=110.0, high=111.0, low=95.0, close=100.0),
+        1,
+    ),
+    Scenario(
+        "mean_reversion_normal_candle_no_signal",
+        _MEAN_REVERSION,
+        _then(_SMALL_BULL_4, open=100.0, high=101.0, low=99.0, close=101.0),
+        0,
+    ),
+    Scenario(
+        "mean_reversion_insufficient_history",
+        MeanReversionStrategy(lookback=20),
+        {"open": [100.0] * 5, "close": [100.0] * 5},
+        0,
+    ),
+    # WickRejectionStrategy
+    Scenario(
+        "wick_lower_rejection_bullish",
+        _WICK_REJECTION,
+        {"open": [100.0], "high": [101.0], "low": [94.0], "close": [101.0]},
+        1,
+    ),
+    Scenario(
+        "wick_upper_rejection_bearish",
+        _WICK_REJECTION,
+        {"open": [101.0], "high": [108.0], "low": [100.0], "close": [100.0]},
+        -1,
+    ),
+    Scenario(
+        "wick_none_no_signal",
+        _WICK_REJECTION,
+        {"open": [100.0], "high": [105.0], "low": [100.0], "close": [105.0]},
+        0,
+    ),
+    Scenario(
+        "wick_doji_no_signal",
+        WickRejectionStrategy(),
+        {"open": [100.0], "high": [101.0], "low": [99.0], "close": [100.0]},
+        0,
+    ),
+    # InsideBarStrategy
+    Scenario(
+        "inside_bar_bullish",
+        _INSIDE_BAR,
+        {
+            "open": [95.0, 98.0],
+            "high": [110.0, 105.0],
+            "low": [90.0, 95.0],
+            "close": [105.0, 103.0],
+        },
+        1,
+    ),
+    Scenario(
+        "inside_bar_bearish",
+        _INSIDE_BAR,
+        {
+            "open": [95.0, 102.0],
+            "high": [110.0, 105.0],
+            "low": [90.0, 95.0],
+            "close": [105.0, 97.0],
+        },
+        -1,
+    ),
+    Scenario(
+        "inside_bar_not_inside_no_signal",
+        _INSIDE_BAR,
+        {
+            "open": [100.0, 103.0],
+            "high": [105.0, 108.0],
+            "low": [95.0, 96.0],
+            "close": [102.0, 106.0],
+        },
+        0,
+    ),
+    # GapFillStrategy
+    Scenario("gap_up_short", _GAP_FILL, {"open": [100.0, 102.0], "close": [100.0, 101.0]}, -1),
+    Scenario("gap_down_long", _GAP_FILL, {"open": [100.0, 98.0], "close": [100.0, 99.0]}, 1),
+    Scenario("gap_none", _GAP_FILL, {"open": [100.0, 100.0], "close": [100.0, 101.0]}, 0),
+    Scenario("gap_tiny_ignored", _GAP_FILL, {"open": [100.0, 100.05], "close": [100.0, 100.1]}, 0),
+    # ConsecutiveReversalStrategy
+    Scenario(
+        "reversal_bullish_streak_triggers_short",
+        _REVERSAL,
+        {"open": [100.0, 102.0, 104.0, 106.0], "close": [102.0, 104.0, 106.0, 108.0]},
+        -1,
+    ),
+    Scenario(
+        "reversal_bearish_streak_triggers_long",
+        _REVERSAL,
+        {"open": [108.0, 106.0, 104.0, 102.0], "close": [106.0, 104.0, 102.0, 100.0]},
+        1,
+    ),
+    Scenario(
+        "reversal_mixed_no_signal",
+        _REVERSAL,
+        {"open": [100.0, 102.0, 100.0, 102.0], "close": [102.0, 100.0, 102.0, 104.0]},
+        0,
+    ),
+    Scenario(
+        "reversal_insufficient_history",
+        _REVERSAL,
+        {"open": [100.0, 100.0, 100.0], "close": [102.0, 102.0, 102.0]},
+        0,
+    ),
+    Scenario(
+        "reversal_custom_n",
+        ConsecutiveReversalStrategy(n_consecutive=2),
+        {"open": [100.0, 102.0], "close": [102.0, 104.0]},
+        -1,
+    ),
+    # FollowLeaderStrategy
+    Scenario("follow_leader_bullish", _FOLLOW_LEADER, {"open": [100.0], "close": [105.0]}, 1),
+    Scenario("follow_leader_bearish", _FOLLOW_LEADER, {"open": [105.0], "close": [100.0]}, -1),
+    Scenario("follow_leader_doji", _FOLLOW_LEADER, {"open": [100.0], "close": [100.0]}, 0),
+]
+
+
+@pytest.mark.parametrize("sc", SCENARIOS, ids=lambda sc: sc.name)
+def test_scenario(sc: Scenario) -> None:
+    assert _get_last_signal(sc.strategy, make_master(**sc.columns)).direction == sc.expected
+
+
+@pytest.mark.parametrize(("open_", "close"), [(100.0, 105.0), (105.0, 100.0)])
+def test_follow_leader_weight(open_: float, close: float) -> None:
+    master = make_master(open=[open_], close=[close])
+    assert _get_last_signal(_FOLLOW_LEADER, master).weight == 50